@@ -1,47 +1,89 @@
 import sys
 import argparse
+import asyncio
+import logging
 import time
 from typing import Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Import SETTINGS to force-load and validate env on startup
-from .utils.config import SETTINGS  # noqa: F401
+import aiohttp
+import httpx
+
 from .utils.claims import (
     extract_claims_from_query,
-    optimize_claim,
     get_query_for_wiki_article,
+    optimize_claim,
+)
+from .utils.google_custom_search import (
+    aget_first_n_results_urls,
+    get_first_n_results_urls,
 )
-from .utils.google_custom_search import get_first_n_results_urls
-from .utils.wikipedia_scraper import scrape_wikipedia_content
-from .utils.factcheck import find_answer_in_article, build_text_fragment_link
+from .utils.wikipedia_scraper import (
+    open_scrape_session,
+    scrape_all,
+    scrape_wikipedia_content,
+)
+from .utils.factcheck import (
+    afind_answer_in_article,
+    collect_factcheck_batch,
+    find_answer_in_article,
+    submit_factcheck_batch,
+)
+from .utils.links import build_text_fragment_link
+from .utils.openai_client import get_async_client
+from .utils.logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Claims in flight at once in the async parallel path
+MAX_CONCURRENT_CLAIMS = 10
+
+
+def format_answer(url: str, result) -> str:
+    """Format a fact-check result and the text fragment link to its evidence."""
+    if result:
+        lines = [
+            "\n=== Answer from article ===",
+            f"Label: {result.label}",
+            f"Evidence: {result.evidence}",
+        ]
+    else:
+        lines = ["Failed to get response"]
+
+    lines.append("\n=== LINK TO RESPONSE ===")
+    lines.append(build_text_fragment_link(url, result.evidence if result else None))
+    return "\n".join(lines)
 
 
 def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
     """Process a single claim and return results with timing info."""
     start_time = time.time()
 
-    print(f"\n\nEvaluating claim: {claim}")
-
-    # Optimize claim
-    opt_start = time.time()
-    optimized = optimize_claim(claim)
-    opt_time = time.time() - opt_start
-    print(f"Optimized claim: {optimized} (took {opt_time:.2f}s)")
+    # Progress goes to debug; the claim's result block is logged once at the end so
+    # blocks from parallel claims don't interleave
+    header = f"\n\nEvaluating claim: {claim}"
 
-    # Get Wikipedia article query
+    # The Wikipedia query never depends on verbosity; the optimized claim is only
+    # used for logging, so it is only generated (separately) at -v
     query_start = time.time()
     article_query = get_query_for_wiki_article(claim)
+    optimized = None
+    if logger.isEnabledFor(logging.DEBUG):
+        optimized = optimize_claim(claim)
+        logger.debug("Optimized claim: %s", optimized)
     query_time = time.time() - query_start
-    print(f"Wikipedia Article To Check: {article_query} (took {query_time:.2f}s)")
+    logger.debug(
+        "Wikipedia Article To Check: %s (took %.2fs)", article_query, query_time
+    )
 
     # Get URLs
     url_start = time.time()
     urls = get_first_n_results_urls(article_query, top_n_urls)
     url_time = time.time() - url_start
-    print(f"URLs Fetched: {urls} (took {url_time:.2f}s)")
+    logger.debug("URLs Fetched: %s (took %.2fs)", urls, url_time)
 
     if not urls:
-        print("No URL found from search")
+        logger.info("%s\nNo URL found from search", header)
         return {
             "claim": claim,
             "optimized": optimized,
@@ -50,7 +92,6 @@ def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
             "result": None,
             "total_time": time.time() - start_time,
             "timing": {
-                "optimize": opt_time,
                 "query": query_time,
                 "urls": url_time,
                 "scrape": 0,
@@ -59,7 +100,7 @@ def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
         }
 
     # Scrape content from all URLs in parallel
-    print(f"\nScraping content from {len(urls)} Wikipedia article(s)...")
+    logger.debug("Scraping content from %s Wikipedia article(s)...", len(urls))
     scrape_start = time.time()
 
     def scrape_url(url):
@@ -75,13 +116,13 @@ def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
                 if content:
                     contents.append((url, content))
             except Exception as e:
-                print(f"Failed to scrape {url}: {e}")
+                logger.warning("Failed to scrape %s: %s", url, e)
 
     scrape_time = time.time() - scrape_start
-    print(f"Scraping completed in {scrape_time:.2f}s")
+    logger.debug("Scraping completed in %.2fs", scrape_time)
 
     if not contents:
-        print("Failed to scrape content from any URL")
+        logger.info("%s\nFailed to scrape content from any URL", header)
         return {
             "claim": claim,
             "optimized": optimized,
@@ -90,7 +131,6 @@ def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
             "result": None,
             "total_time": time.time() - start_time,
             "timing": {
-                "optimize": opt_time,
                 "query": query_time,
                 "urls": url_time,
                 "scrape": scrape_time,
@@ -106,19 +146,11 @@ def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
     result = find_answer_in_article(content, claim)
     factcheck_time = time.time() - factcheck_start
 
-    if result:
-        print("\n=== Answer from article ===")
-        print(f"Label: {result.label}")
-        print(f"Evidence: {result.evidence}")
-    else:
-        print("Failed to get response")
-
-    print("\n=== LINK TO RESPONSE ===")
-    link = build_text_fragment_link(url, result.evidence if result else None)
-    print(link)
+    lines = [header, format_answer(url, result)]
 
     total_time = time.time() - start_time
-    print(f"Total time for claim: {total_time:.2f}s")
+    lines.append(f"Total time for claim: {total_time:.2f}s")
+    logger.info("\n".join(lines))
 
     return {
         "claim": claim,
@@ -128,7 +160,6 @@ def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
         "result": result,
         "total_time": total_time,
         "timing": {
-            "optimize": opt_time,
             "query": query_time,
             "urls": url_time,
             "scrape": scrape_time,
@@ -140,20 +171,26 @@ def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
 def process_query_sequential(query: str, top_n_urls: int = 1) -> int:
     """Original sequential processing for comparison."""
     start_time = time.time()
-    print(f"Query: {query}")
+    logger.info("Query: %s", query)
 
     # Extract claims
     claims_start = time.time()
     claims = extract_claims_from_query(query)
     claims_time = time.time() - claims_start
-    print(f"Claims: {claims} (extraction took {claims_time:.2f}s)")
+    logger.info("Claims: %s (extraction took %.2fs)", claims, claims_time)
 
     if not claims:
-        print("No claims found to process")
+        logger.info("No claims found to process")
         return 0
 
+    # Identical claims would do identical LLM and scraping work, so only process each once
+    unique_claims = list(dict.fromkeys(claims))
+    if len(unique_claims) < len(claims):
+        logger.info("Skipping %s duplicate claim(s)", len(claims) - len(unique_claims))
+    claims = unique_claims
+
     # Process claims sequentially
-    print(f"\nProcessing {len(claims)} claims sequentially...")
+    logger.info("\nProcessing %s claims sequentially...", len(claims))
     results = []
 
     for claim in claims:
@@ -162,17 +199,67 @@ def process_query_sequential(query: str, top_n_urls: int = 1) -> int:
 
     # Print summary
     total_time = time.time() - start_time
-    print(f"\n{'=' * 50}")
-    print("SEQUENTIAL SUMMARY")
-    print(f"{'=' * 50}")
-    print(f"Total processing time: {total_time:.2f}s")
-    print(f"Claims extraction time: {claims_time:.2f}s")
-    print(f"Claims processing time: {total_time - claims_time:.2f}s")
+    logger.info("\n%s", "=" * 50)
+    logger.info("SEQUENTIAL SUMMARY")
+    logger.info("%s", "=" * 50)
+    logger.info("Total processing time: %.2fs", total_time)
+    logger.info("Claims extraction time: %.2fs", claims_time)
+    logger.info("Claims processing time: %.2fs", total_time - claims_time)
 
     if results:
         avg_claim_time = sum(r["total_time"] for r in results) / len(results)
-        print(f"Average time per claim: {avg_claim_time:.2f}s")
+        logger.info("Average time per claim: %.2fs", avg_claim_time)
+
+    return 0
+
+
+def process_query_batch(
+    query: str, top_n_urls: int = 1, poll_interval: float = 30.0
+) -> int:
+    """
+    Offline/eval mode: search and scrape every claim, then fact-check them all as one
+    Batch API job (half the price, results within 24h). Blocks until the job ends.
+    """
+    logger.info("Query: %s", query)
+    claims = list(dict.fromkeys(extract_claims_from_query(query)))
+    logger.info("Claims: %s", claims)
+    if not claims:
+        logger.info("No claims found to process")
+        return 0
+
+    # (claim, url, scraped content) for every claim with something to check
+    checkable = []
+    for claim in claims:
+        article_query = get_query_for_wiki_article(claim)
+        urls = get_first_n_results_urls(article_query, top_n_urls)
+        if not urls:
+            logger.info("\n\nEvaluating claim: %s\nNo URL found from search", claim)
+            continue
+        for url in urls:
+            content = scrape_wikipedia_content(url)
+            if content:
+                checkable.append((claim, url, content))
+                break
+        else:
+            logger.info(
+                "\n\nEvaluating claim: %s\nFailed to scrape content from any URL", claim
+            )
+
+    if not checkable:
+        return 0
 
+    batch_id = submit_factcheck_batch(
+        [(content, claim) for claim, _url, content in checkable]
+    )
+    logger.info(
+        "\nSubmitted fact-check batch %s for %s claim(s); waiting...",
+        batch_id,
+        len(checkable),
+    )
+    results = collect_factcheck_batch(batch_id, len(checkable), poll_interval)
+
+    for (claim, url, _content), result in zip(checkable, results):
+        logger.info("\n\nEvaluating claim: %s\n%s", claim, format_answer(url, result))
     return 0
 
 
@@ -184,65 +271,160 @@ def process_query(query: str, top_n_urls: int = 1, parallel: bool = True) -> int
         return process_query_sequential(query, top_n_urls)
 
 
+async def aprocess_single_claim(
+    claim: str,
+    top_n_urls: int,
+    http: httpx.AsyncClient,
+    scraper: aiohttp.ClientSession,
+    llm,
+    limit: asyncio.Semaphore,
+) -> dict:
+    """
+    Async process_single_claim. Search, scraping and fact-checking run on the shared
+    clients of the calling batch; `limit` bounds how many claims are in flight.
+    """
+    async with limit:
+        start_time = time.time()
+        header = f"\n\nEvaluating claim: {claim}"
+
+        # Query generation goes through the sync on-disk LLM cache, so off the loop
+        query_start = time.time()
+        optimized = None
+        if logger.isEnabledFor(logging.DEBUG):
+            # The optimized claim is independent of the query, so both requests run at once
+            article_query, optimized = await asyncio.gather(
+                asyncio.to_thread(get_query_for_wiki_article, claim),
+                asyncio.to_thread(optimize_claim, claim),
+            )
+            logger.debug("Optimized claim: %s", optimized)
+        else:
+            article_query = await asyncio.to_thread(get_query_for_wiki_article, claim)
+        query_time = time.time() - query_start
+        logger.debug(
+            "Wikipedia Article To Check: %s (took %.2fs)", article_query, query_time
+        )
+
+        url_start = time.time()
+        urls = await aget_first_n_results_urls(http, article_query, top_n_urls)
+        url_time = time.time() - url_start
+        logger.debug("URLs Fetched: %s (took %.2fs)", urls, url_time)
+
+        scrape_time = factcheck_time = 0
+        result = None
+        if not urls:
+            logger.info("%s\nNo URL found from search", header)
+        else:
+            scrape_start = time.time()
+            contents = [
+                (url, c) for url, c in zip(urls, await scrape_all(urls, scraper)) if c
+            ]
+            scrape_time = time.time() - scrape_start
+            logger.debug("Scraping completed in %.2fs", scrape_time)
+
+            if not contents:
+                logger.info("%s\nFailed to scrape content from any URL", header)
+            else:
+                # Use the first successfully scraped content for fact-checking
+                url, content = contents[0]
+                factcheck_start = time.time()
+                result = await afind_answer_in_article(content, claim, llm)
+                factcheck_time = time.time() - factcheck_start
+
+                lines = [header, format_answer(url, result)]
+                lines.append(f"Total time for claim: {time.time() - start_time:.2f}s")
+                logger.info("\n".join(lines))
+
+        return {
+            "claim": claim,
+            "optimized": optimized,
+            "article_query": article_query,
+            "urls": urls,
+            "result": result,
+            "total_time": time.time() - start_time,
+            "timing": {
+                "query": query_time,
+                "urls": url_time,
+                "scrape": scrape_time,
+                "factcheck": factcheck_time,
+            },
+        }
+
+
+async def aprocess_claims(claims: list[str], top_n_urls: int = 1) -> list[dict]:
+    """Run every claim concurrently on one shared HTTP client and one shared OpenAI client."""
+    limit = asyncio.Semaphore(MAX_CONCURRENT_CLAIMS)
+    llm = get_async_client()
+    # One HTTP client and one scraping session for the whole batch of claims
+    async with (
+        httpx.AsyncClient(follow_redirects=True, timeout=httpx.Timeout(30)) as http,
+        open_scrape_session() as scraper,
+    ):
+        outcomes = await asyncio.gather(
+            *[
+                aprocess_single_claim(claim, top_n_urls, http, scraper, llm, limit)
+                for claim in claims
+            ],
+            return_exceptions=True,
+        )
+
+    results = []
+    for claim, outcome in zip(claims, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error("Failed to process claim '%s': %s", claim, outcome)
+        else:
+            results.append(outcome)
+    return results
+
+
 def process_query_parallel(query: str, top_n_urls: int = 1) -> int:
-    """Parallel processing version."""
+    """Parallel processing version: all claims run concurrently on one event loop."""
     start_time = time.time()
-    print(f"Query: {query}")
+    logger.info("Query: %s", query)
 
     # Extract claims
     claims_start = time.time()
     claims = extract_claims_from_query(query)
     claims_time = time.time() - claims_start
-    print(f"Claims: {claims} (extraction took {claims_time:.2f}s)")
+    logger.info("Claims: %s (extraction took %.2fs)", claims, claims_time)
 
     if not claims:
-        print("No claims found to process")
+        logger.info("No claims found to process")
         return 0
 
-    # Process claims in parallel
-    print(f"\nProcessing {len(claims)} claims in parallel...")
-    results = []
-
-    with ThreadPoolExecutor(max_workers=min(len(claims), 3)) as executor:
-        future_to_claim = {
-            executor.submit(process_single_claim, claim, top_n_urls): claim
-            for claim in claims
-        }
+    # Identical claims would do identical LLM and scraping work, so only process each once
+    unique_claims = list(dict.fromkeys(claims))
+    if len(unique_claims) < len(claims):
+        logger.info("Skipping %s duplicate claim(s)", len(claims) - len(unique_claims))
+    claims = unique_claims
 
-        for future in as_completed(future_to_claim):
-            claim = future_to_claim[future]
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"Failed to process claim '{claim}': {e}")
+    # Process claims in parallel
+    logger.info("\nProcessing %s claims in parallel...", len(claims))
+    results = asyncio.run(aprocess_claims(claims, top_n_urls))
 
     # Print summary
     total_time = time.time() - start_time
-    print(f"\n{'=' * 50}")
-    print("PARALLEL SUMMARY")
-    print(f"{'=' * 50}")
-    print(f"Total processing time: {total_time:.2f}s")
-    print(f"Claims extraction time: {claims_time:.2f}s")
-    print(f"Claims processing time: {total_time - claims_time:.2f}s")
+    logger.info("\n%s", "=" * 50)
+    logger.info("PARALLEL SUMMARY")
+    logger.info("%s", "=" * 50)
+    logger.info("Total processing time: %.2fs", total_time)
+    logger.info("Claims extraction time: %.2fs", claims_time)
+    logger.info("Claims processing time: %.2fs", total_time - claims_time)
 
     if results:
         avg_claim_time = sum(r["total_time"] for r in results) / len(results)
-        print(f"Average time per claim: {avg_claim_time:.2f}s")
+        logger.info("Average time per claim: %.2fs", avg_claim_time)
 
         # Timing breakdown
-        total_optimize = sum(r["timing"]["optimize"] for r in results)
         total_query = sum(r["timing"]["query"] for r in results)
         total_urls = sum(r["timing"]["urls"] for r in results)
         total_scrape = sum(r["timing"]["scrape"] for r in results)
         total_factcheck = sum(r["timing"]["factcheck"] for r in results)
 
-        print("\nTiming breakdown:")
-        print(f"  - Claim optimization: {total_optimize:.2f}s")
-        print(f"  - Wiki query generation: {total_query:.2f}s")
-        print(f"  - URL fetching: {total_urls:.2f}s")
-        print(f"  - Content scraping: {total_scrape:.2f}s")
-        print(f"  - Fact-checking: {total_factcheck:.2f}s")
+        logger.info("\nTiming breakdown:")
+        logger.info("  - Wiki query: %.2fs", total_query)
+        logger.info("  - URL fetching: %.2fs", total_urls)
+        logger.info("  - Content scraping: %.2fs", total_scrape)
+        logger.info("  - Fact-checking: %.2fs", total_factcheck)
 
     return 0
 
@@ -263,22 +445,40 @@ def main(argv: Optional[list] = None) -> int:
         action="store_true",
         help="Run both sequential and parallel versions for comparison",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Fact-check through the Batch API (cheaper; waits up to 24h for results)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Show per-step progress (-v) and library debug output (-vv)",
+    )
     args = parser.parse_args(argv)
+    configure_logging(args.verbose)
 
     query = " ".join(args.query)
 
+    if args.batch:
+        return process_query_batch(query, args.top_n)
+
     if args.compare:
-        print("Running comparison between sequential and parallel processing...\n")
+        logger.info(
+            "Running comparison between sequential and parallel processing...\n"
+        )
 
         # Run sequential first
-        print("=" * 60)
-        print("SEQUENTIAL PROCESSING")
-        print("=" * 60)
+        logger.info("=" * 60)
+        logger.info("SEQUENTIAL PROCESSING")
+        logger.info("=" * 60)
         process_query(query, args.top_n, parallel=False)
 
-        print("\n" + "=" * 60)
-        print("PARALLEL PROCESSING")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("PARALLEL PROCESSING")
+        logger.info("=" * 60)
         process_query(query, args.top_n, parallel=True)
 
         return 0
@@ -5,139 +5,209 @@ This replaces OpenAI API calls with local model calls while keeping all other fu
 
 import sys
 import argparse
+import asyncio
+import atexit
+import logging
 import time
 from typing import Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
-# Import SETTINGS to force-load and validate env on startup
-from .utils.config import SETTINGS  # noqa: F401
 from .utils.local_claims import (
     extract_claims_from_query,
-    optimize_claim,
     get_query_for_wiki_article,
+    get_queries_for_wiki_articles,
+    optimize_claims,
 )
 from .utils.google_custom_search import get_first_n_results_urls
-from .utils.wikipedia_scraper import scrape_wikipedia_content
-from .utils.local_factcheck_full import find_answer_in_article, build_text_fragment_link
+from .utils.wikipedia_scraper import scrape_all
+from .utils.local_factcheck_full import find_answer_in_article, find_answers_in_articles
+from .utils.links import build_text_fragment_link
 from .utils.local_openai_client import LocalOpenAIClient, set_local_openai_client
+from .utils.logging_config import configure_logging
 
+logger = logging.getLogger(__name__)
 
-def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
-    """Process a single claim and return results with timing info."""
-    start_time = time.time()
-
-    print(f"\n\nEvaluating claim: {claim}")
-
-    # Optimize claim
-    opt_start = time.time()
-    optimized = optimize_claim(claim)
-    opt_time = time.time() - opt_start
-    print(f"Optimized claim: {optimized} (took {opt_time:.2f}s)")
+# One long-lived pool for I/O fan-out instead of spinning up threads per query
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+atexit.register(_EXECUTOR.shutdown, wait=False)
 
-    # Get Wikipedia article query
-    query_start = time.time()
-    article_query = get_query_for_wiki_article(claim)
-    query_time = time.time() - query_start
-    print(f"Wikipedia Article To Check: {article_query} (took {query_time:.2f}s)")
 
-    # Get URLs
+async def asearch_and_scrape(article_query: str, top_n_urls: int = 1) -> dict:
+    """Search for a claim's Wikipedia article(s) and scrape their content."""
+    # Get URLs (blocking client, so off the event loop)
     url_start = time.time()
-    urls = get_first_n_results_urls(article_query, top_n_urls)
+    urls = await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR, get_first_n_results_urls, article_query, top_n_urls
+    )
     url_time = time.time() - url_start
-    print(f"URLs Fetched: {urls} (took {url_time:.2f}s)")
+    logger.debug("URLs Fetched: %s (took %.2fs)", urls, url_time)
 
     if not urls:
-        print("No URL found from search")
-        return {
-            "claim": claim,
-            "optimized": optimized,
-            "article_query": article_query,
-            "urls": None,
-            "result": None,
-            "total_time": time.time() - start_time,
-            "timing": {
-                "optimize": opt_time,
-                "query": query_time,
-                "urls": url_time,
-                "scrape": 0,
-                "factcheck": 0,
-            },
-        }
+        return {"urls": None, "contents": [], "url_time": url_time, "scrape_time": 0}
 
-    # Scrape content from all URLs in parallel
-    print(f"\nScraping content from {len(urls)} Wikipedia article(s)...")
+    # Scrape content from all URLs concurrently
+    logger.debug("Scraping content from %d Wikipedia article(s)...", len(urls))
     scrape_start = time.time()
 
-    def scrape_url(url):
-        return scrape_wikipedia_content(url)
-
-    contents = []
-    with ThreadPoolExecutor(max_workers=min(len(urls), 3)) as executor:
-        future_to_url = {executor.submit(scrape_url, url): url for url in urls}
-        for future in as_completed(future_to_url):
-            url = future_to_url[future]
-            try:
-                content = future.result()
-                if content:
-                    contents.append((url, content))
-            except Exception as e:
-                print(f"Failed to scrape {url}: {e}")
+    contents = [
+        (url, content)
+        for url, content in zip(urls, await scrape_all(urls))
+        if content
+    ]
 
     scrape_time = time.time() - scrape_start
-    print(f"Scraping completed in {scrape_time:.2f}s")
-
-    if not contents:
-        print("Failed to scrape content from any URL")
-        return {
-            "claim": claim,
-            "optimized": optimized,
-            "article_query": article_query,
-            "urls": urls,
-            "result": None,
-            "total_time": time.time() - start_time,
-            "timing": {
-                "optimize": opt_time,
-                "query": query_time,
-                "urls": url_time,
-                "scrape": scrape_time,
-                "factcheck": 0,
-            },
-        }
-
-    # Use the first successfully scraped content for fact-checking
-    url, content = contents[0]
+    logger.debug("Scraping completed in %.2fs", scrape_time)
+
+    return {"urls": urls, "contents": contents, "url_time": url_time, "scrape_time": scrape_time}
+
+
+def fetch_failure(fetched: dict) -> Optional[str]:
+    """Why asearch_and_scrape produced nothing to fact-check, for the claim's result block."""
+    if not fetched["urls"]:
+        return "No URL found from search"
+    if not fetched["contents"]:
+        return "Failed to scrape content from any URL"
+    return None
+
+
+def search_and_scrape(article_query: str, top_n_urls: int = 1) -> dict:
+    """Blocking wrapper around asearch_and_scrape."""
+    return asyncio.run(asearch_and_scrape(article_query, top_n_urls))
+
+
+async def scrape_and_factcheck(
+    claims: list[str], article_queries: list[str], top_n_urls: int = 1
+) -> tuple[list[dict], dict, dict]:
+    """
+    Producer/consumer pipeline: every claim is searched and scraped concurrently,
+    and as soon as any scrapes land they are fact-checked as one batch while the
+    rest are still downloading.
+    Returns (fetched per claim, result by claim index, fact-check time by claim index).
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    fetched: list[Optional[dict]] = [None] * len(claims)
+
+    async def produce(i: int, article_query: str) -> None:
+        try:
+            fetched[i] = await asearch_and_scrape(article_query, top_n_urls)
+        except Exception as e:
+            logger.error("Failed to fetch '%s': %s", article_query, e)
+            fetched[i] = {"urls": None, "contents": [], "url_time": 0, "scrape_time": 0}
+        await queue.put(i)
+
+    producers = [
+        asyncio.create_task(produce(i, article_query))
+        for i, article_query in enumerate(article_queries)
+    ]
+
+    answers: dict = {}
+    factcheck_times: dict = {}
+    remaining = len(claims)
+    while remaining:
+        # Wait for one scrape, then take everything else that is already done
+        ready = [await queue.get()]
+        while not queue.empty():
+            ready.append(queue.get_nowait())
+        remaining -= len(ready)
+
+        batch = [i for i in ready if fetched[i]["contents"]]
+        if not batch:
+            continue
+        factcheck_start = time.time()
+        results = await loop.run_in_executor(
+            _EXECUTOR,
+            find_answers_in_articles,
+            [(fetched[i]["contents"][0][1], claims[i]) for i in batch],
+        )
+        factcheck_time = time.time() - factcheck_start
+        logger.debug("Fact-checked %s claim(s) in %.2fs", len(batch), factcheck_time)
+        for i, result in zip(batch, results):
+            answers[i] = result
+            factcheck_times[i] = factcheck_time / len(batch)
+
+    await asyncio.gather(*producers)
+    return fetched, answers, factcheck_times
+
+
+def get_article_queries(claims: list[str]) -> list[tuple[Optional[str], str]]:
+    """
+    (optimized claim, Wikipedia query) for each claim. The query never depends on
+    verbosity; the optimized claim is only used for logging, so it is only generated
+    (by one extra batch) at -v and is None otherwise.
+    """
+    if len(claims) == 1:
+        queries = [get_query_for_wiki_article(claims[0])]
+    else:
+        queries = get_queries_for_wiki_articles(claims)
+    if logger.isEnabledFor(logging.DEBUG):
+        optimized = optimize_claims(claims)
+    else:
+        optimized = [None] * len(claims)
+    return list(zip(optimized, queries))
 
-    # Fact-check
-    factcheck_start = time.time()
-    result = find_answer_in_article(content, claim)
-    factcheck_time = time.time() - factcheck_start
 
+def format_answer(url: str, result) -> str:
+    """Format a fact-check result and the text fragment link to its evidence."""
     if result:
-        print("\n=== Answer from article ===")
-        print(f"Label: {result.label}")
-        print(f"Evidence: {result.evidence}")
+        lines = [
+            "\n=== Answer from article ===",
+            f"Label: {result.label}",
+            f"Evidence: {result.evidence}",
+        ]
     else:
-        print("Failed to get response")
+        lines = ["Failed to get response"]
+
+    lines.append("\n=== LINK TO RESPONSE ===")
+    lines.append(build_text_fragment_link(url, result.evidence if result else None))
+    return "\n".join(lines)
+
+
+def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
+    """Process a single claim and return results with timing info."""
+    start_time = time.time()
 
-    print("\n=== LINK TO RESPONSE ===")
-    link = build_text_fragment_link(url, result.evidence if result else None)
-    print(link)
+    lines = [f"\n\nEvaluating claim: {claim}"]
+
+    # Get Wikipedia article query (plus the optimized claim at -v)
+    query_start = time.time()
+    [(optimized, article_query)] = get_article_queries([claim])
+    query_time = time.time() - query_start
+    logger.debug("Optimized claim: %s", optimized)
+    logger.debug("Wikipedia Article To Check: %s (took %.2fs)", article_query, query_time)
+
+    fetched = search_and_scrape(article_query, top_n_urls)
+
+    result = None
+    factcheck_time = 0
+    if fetched["contents"]:
+        # Use the first successfully scraped content for fact-checking
+        url, content = fetched["contents"][0]
+
+        # Fact-check
+        factcheck_start = time.time()
+        result = find_answer_in_article(content, claim)
+        factcheck_time = time.time() - factcheck_start
+
+        lines.append(format_answer(url, result))
+    else:
+        lines.append(fetch_failure(fetched))
 
     total_time = time.time() - start_time
-    print(f"Total time for claim: {total_time:.2f}s")
+    lines.append(f"Total time for claim: {total_time:.2f}s")
+    logger.info("\n".join(lines))
 
     return {
         "claim": claim,
         "optimized": optimized,
         "article_query": article_query,
-        "urls": urls,
+        "urls": fetched["urls"],
         "result": result,
         "total_time": total_time,
         "timing": {
-            "optimize": opt_time,
             "query": query_time,
-            "urls": url_time,
-            "scrape": scrape_time,
+            "urls": fetched["url_time"],
+            "scrape": fetched["scrape_time"],
             "factcheck": factcheck_time,
         },
     }
@@ -146,20 +216,26 @@ def process_single_claim(claim: str, top_n_urls: int = 1) -> dict:
 def process_query_sequential(query: str, top_n_urls: int = 1) -> int:
     """Original sequential processing for comparison."""
     start_time = time.time()
-    print(f"Query: {query}")
+    logger.info("Query: %s", query)
 
     # Extract claims
     claims_start = time.time()
     claims = extract_claims_from_query(query)
     claims_time = time.time() - claims_start
-    print(f"Claims: {claims} (extraction took {claims_time:.2f}s)")
+    logger.info("Claims: %s (extraction took %.2fs)", claims, claims_time)
 
     if not claims:
-        print("No claims found to process")
+        logger.info("No claims found to process")
         return 0
 
+    # Identical claims would do identical LLM and scraping work, so only process each once
+    unique_claims = list(dict.fromkeys(claims))
+    if len(unique_claims) < len(claims):
+        logger.info("Skipping %s duplicate claim(s)", len(claims) - len(unique_claims))
+    claims = unique_claims
+
     # Process claims sequentially
-    print(f"\nProcessing {len(claims)} claims sequentially...")
+    logger.info("\nProcessing %s claims sequentially...", len(claims))
     results = []
 
     for claim in claims:
@@ -168,79 +244,115 @@ def process_query_sequential(query: str, top_n_urls: int = 1) -> int:
 
     # Print summary
     total_time = time.time() - start_time
-    print(f"\n{'=' * 50}")
-    print("SEQUENTIAL SUMMARY")
-    print(f"{'=' * 50}")
-    print(f"Total processing time: {total_time:.2f}s")
-    print(f"Claims extraction time: {claims_time:.2f}s")
-    print(f"Claims processing time: {total_time - claims_time:.2f}s")
+    logger.info("\n%s", "=" * 50)
+    logger.info("SEQUENTIAL SUMMARY")
+    logger.info("%s", "=" * 50)
+    logger.info("Total processing time: %.2fs", total_time)
+    logger.info("Claims extraction time: %.2fs", claims_time)
+    logger.info("Claims processing time: %.2fs", total_time - claims_time)
 
     if results:
         avg_claim_time = sum(r["total_time"] for r in results) / len(results)
-        print(f"Average time per claim: {avg_claim_time:.2f}s")
+        logger.info("Average time per claim: %.2fs", avg_claim_time)
 
     return 0
 
 
 def process_query_parallel(query: str, top_n_urls: int = 1) -> int:
-    """Parallel processing version."""
+    """
+    Parallel processing version: Wikipedia queries run as one model batch, then
+    scraping and fact-checking are pipelined (see scrape_and_factcheck).
+    """
     start_time = time.time()
-    print(f"Query: {query}")
+    logger.info("Query: %s", query)
 
     # Extract claims
     claims_start = time.time()
     claims = extract_claims_from_query(query)
     claims_time = time.time() - claims_start
-    print(f"Claims: {claims} (extraction took {claims_time:.2f}s)")
+    logger.info("Claims: %s (extraction took %.2fs)", claims, claims_time)
 
     if not claims:
-        print("No claims found to process")
+        logger.info("No claims found to process")
         return 0
 
-    # Process claims in parallel
-    print(f"\nProcessing {len(claims)} claims in parallel...")
-    results = []
+    # Identical claims would do identical LLM and scraping work, so only process each once
+    unique_claims = list(dict.fromkeys(claims))
+    if len(unique_claims) < len(claims):
+        logger.info("Skipping %s duplicate claim(s)", len(claims) - len(unique_claims))
+    claims = unique_claims
 
-    with ThreadPoolExecutor(max_workers=min(len(claims), 3)) as executor:
-        future_to_claim = {
-            executor.submit(process_single_claim, claim, top_n_urls): claim
-            for claim in claims
-        }
+    # Get every claim's Wikipedia query in one batched model call
+    logger.info("\nProcessing %s claims in batches...", len(claims))
+    query_start = time.time()
+    queries = get_article_queries(claims)
+    query_time = time.time() - query_start
+    logger.debug("Wiki queries took %.2fs", query_time)
 
-        for future in as_completed(future_to_claim):
-            claim = future_to_claim[future]
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"Failed to process claim '{claim}': {e}")
+    # Fact-check claims in batches as their scrapes finish, instead of after all of them
+    fetched, answer_by_index, factcheck_times = asyncio.run(
+        scrape_and_factcheck(claims, [q for _optimized, q in queries], top_n_urls)
+    )
+
+    results = []
+    for i, claim in enumerate(claims):
+        optimized, article_query = queries[i]
+
+        # One record per claim so its block is written in a single piece
+        lines = [f"\n\nEvaluating claim: {claim}"]
+        if logger.isEnabledFor(logging.DEBUG):
+            lines.append(f"Optimized claim: {optimized}")
+            lines.append(f"Wikipedia Article To Check: {article_query}")
+
+        result = answer_by_index.get(i)
+        if i in answer_by_index:
+            lines.append(format_answer(fetched[i]["contents"][0][0], result))
+        else:
+            lines.append(fetch_failure(fetched[i]))
+        logger.info("\n".join(lines))
+
+        timing = {
+            "query": query_time / len(claims),
+            "urls": fetched[i]["url_time"],
+            "scrape": fetched[i]["scrape_time"],
+            "factcheck": factcheck_times.get(i, 0),
+        }
+        results.append(
+            {
+                "claim": claim,
+                "optimized": optimized,
+                "article_query": article_query,
+                "urls": fetched[i]["urls"],
+                "result": result,
+                "total_time": sum(timing.values()),
+                "timing": timing,
+            }
+        )
 
     # Print summary
     total_time = time.time() - start_time
-    print(f"\n{'=' * 50}")
-    print("PARALLEL SUMMARY")
-    print(f"{'=' * 50}")
-    print(f"Total processing time: {total_time:.2f}s")
-    print(f"Claims extraction time: {claims_time:.2f}s")
-    print(f"Claims processing time: {total_time - claims_time:.2f}s")
+    logger.info("\n%s", "=" * 50)
+    logger.info("PARALLEL SUMMARY")
+    logger.info("%s", "=" * 50)
+    logger.info("Total processing time: %.2fs", total_time)
+    logger.info("Claims extraction time: %.2fs", claims_time)
+    logger.info("Claims processing time: %.2fs", total_time - claims_time)
 
     if results:
         avg_claim_time = sum(r["total_time"] for r in results) / len(results)
-        print(f"Average time per claim: {avg_claim_time:.2f}s")
+        logger.info("Average time per claim: %.2fs", avg_claim_time)
 
         # Timing breakdown
-        total_optimize = sum(r["timing"]["optimize"] for r in results)
         total_query = sum(r["timing"]["query"] for r in results)
         total_urls = sum(r["timing"]["urls"] for r in results)
         total_scrape = sum(r["timing"]["scrape"] for r in results)
         total_factcheck = sum(r["timing"]["factcheck"] for r in results)
 
-        print("\nTiming breakdown:")
-        print(f"  - Claim optimization: {total_optimize:.2f}s")
-        print(f"  - Wiki query generation: {total_query:.2f}s")
-        print(f"  - URL fetching: {total_urls:.2f}s")
-        print(f"  - Content scraping: {total_scrape:.2f}s")
-        print(f"  - Fact-checking: {total_factcheck:.2f}s")
+        logger.info("\nTiming breakdown:")
+        logger.info("  - Wiki query: %.2fs", total_query)
+        logger.info("  - URL fetching: %.2fs", total_urls)
+        logger.info("  - Content scraping: %.2fs", total_scrape)
+        logger.info("  - Fact-checking: %.2fs", total_factcheck)
 
     return 0
 
@@ -279,28 +391,36 @@ def main(argv: Optional[list] = None) -> int:
         default="local-model",
         help="Model name to use"
     )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Show per-step progress (-v) and library debug output (-vv)",
+    )
     args = parser.parse_args(argv)
+    configure_logging(args.verbose)
 
     # Set up local model client
     local_client = LocalOpenAIClient(args.base_url, args.model)
     set_local_openai_client(local_client)
     
-    print(f"Using local model at {args.base_url} with model '{args.model}'")
+    logger.info("Using local model at %s with model '%s'", args.base_url, args.model)
 
     query = " ".join(args.query)
 
     if args.compare:
-        print("Running comparison between sequential and parallel processing...\n")
+        logger.info("Running comparison between sequential and parallel processing...\n")
 
         # Run sequential first
-        print("=" * 60)
-        print("SEQUENTIAL PROCESSING")
-        print("=" * 60)
+        logger.info("=" * 60)
+        logger.info("SEQUENTIAL PROCESSING")
+        logger.info("=" * 60)
         process_query(query, args.top_n, parallel=False)
 
-        print("\n" + "=" * 60)
-        print("PARALLEL PROCESSING")
-        print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("PARALLEL PROCESSING")
+        logger.info("=" * 60)
         process_query(query, args.top_n, parallel=True)
 
         return 0
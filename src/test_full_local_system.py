@@ -7,17 +7,37 @@ This runs the complete original pipeline but with local models instead of OpenAI
 import sys
 import json
 import time
+import asyncio
+import functools
+import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+import orjson
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.local_openai_client import LocalOpenAIClient, set_local_openai_client
-from utils.local_claims import extract_claims_from_query, optimize_claim, get_query_for_wiki_article
+from utils.local_claims import (
+    extract_claims_from_query,
+    get_query_for_wiki_article,
+    get_queries_for_wiki_articles,
+    optimize_claim,
+)
 from utils.google_custom_search import get_first_n_results_urls
-from utils.wikipedia_scraper import scrape_wikipedia_content
-from utils.local_factcheck_full import find_answer_in_article, build_text_fragment_link
+from utils.wikipedia_scraper import scrape_wikipedia_content, scrape_all
+from utils.local_factcheck_full import find_answer_in_article, find_answers_in_articles
+from utils.logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_jsonl(path_str: str) -> tuple:
+    """Parse a .jsonl file once per process; repeated runs reuse the parsed records."""
+    with open(path_str, 'rb') as f:
+        return tuple(orjson.loads(line) for line in f if line.strip())
 
 
 class FullLocalTestRunner:
@@ -31,20 +51,28 @@ class FullLocalTestRunner:
         local_client = LocalOpenAIClient(base_url, model)
         set_local_openai_client(local_client)
         
-        print(f"Using local model at {base_url} with model '{model}'")
+        logger.info(f"Using local model at {base_url} with model '{model}'")
     
     def load_test_dataset(self, dataset_name: str = "test_claims_wikipedia") -> List[Dict[str, Any]]:
         """Load test dataset."""
         dataset_path = Path(f"src/data/{dataset_name}.jsonl")
-        dataset = []
-        
-        with open(dataset_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    dataset.append(json.loads(line))
-        
-        return dataset
+        # Copies, so callers can't mutate the cached records
+        return [dict(record) for record in _load_jsonl(str(dataset_path.resolve()))]
+    
+    def _new_result(self, test_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Empty result record for a test case."""
+        return {
+            'test_id': test_data['id'],
+            'claim': test_data['claim'],
+            'expected_label': test_data['expected_label'],
+            'predicted_label': None,
+            'evidence': None,
+            'is_correct': False,
+            'processing_time': 0,
+            'error': None,
+            'article_query': None,
+            'urls': []
+        }
     
     def test_single_claim(self, test_data: Dict[str, Any]) -> Dict[str, Any]:
         """Test a single claim using the full local system."""
@@ -54,92 +82,154 @@ class FullLocalTestRunner:
         claim = test_data['claim']
         expected_label = test_data['expected_label']
         
-        print(f"\nProcessing test {test_id}: {claim}")
+        logger.info(f"\nProcessing test {test_id}: {claim}")
         
-        result = {
-            'test_id': test_id,
-            'claim': claim,
-            'expected_label': expected_label,
-            'predicted_label': None,
-            'evidence': None,
-            'is_correct': False,
-            'processing_time': 0,
-            'error': None,
-            'article_query': None,
-            'urls': []
-        }
+        result = self._new_result(test_data)
         
         try:
-            # Step 1: Optimize claim
-            print(f"  Optimizing claim...")
-            optimized_claim = optimize_claim(claim)
-            print(f"  Optimized: {optimized_claim}")
-            
-            # Step 2: Get Wikipedia article query
-            print(f"  Getting Wikipedia query...")
+            # Steps 1-2: Get Wikipedia article query; the optimized claim is only
+            # logged, so it is only generated at -v and never changes the query
+            logger.debug("  Getting Wikipedia query...")
             article_query = get_query_for_wiki_article(claim)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  Optimized: %s", optimize_claim(claim))
             result['article_query'] = article_query
-            print(f"  Query: {article_query}")
+            logger.debug(f"  Query: {article_query}")
             
             # Step 3: Get URLs
-            print(f"  Fetching URLs...")
+            logger.debug(f"  Fetching URLs...")
             urls = get_first_n_results_urls(article_query, 1)
             result['urls'] = urls
-            print(f"  URLs: {urls}")
+            logger.debug(f"  URLs: {urls}")
             
             if not urls:
                 result['error'] = "No URLs found"
                 return result
             
             # Step 4: Scrape content
-            print(f"  Scraping content...")
+            logger.debug(f"  Scraping content...")
             content = scrape_wikipedia_content(urls[0])
             if not content:
                 result['error'] = "Failed to scrape content"
                 return result
             
-            print(f"  Scraped {len(content)} characters")
+            logger.debug(f"  Scraped {len(content)} characters")
             
             # Step 5: Fact-check
-            print(f"  Fact-checking...")
+            logger.debug(f"  Fact-checking...")
             factcheck_result = find_answer_in_article(content, claim)
             
             if factcheck_result:
                 result['predicted_label'] = factcheck_result.label
                 result['evidence'] = factcheck_result.evidence
                 result['is_correct'] = (result['predicted_label'] == expected_label)
-                print(f"  Predicted: {result['predicted_label']}, Expected: {expected_label}, Correct: {result['is_correct']}")
+                logger.debug(f"  Predicted: {result['predicted_label']}, Expected: {expected_label}, Correct: {result['is_correct']}")
             else:
                 result['error'] = "Failed to get factcheck result"
             
         except Exception as e:
             result['error'] = str(e)
-            print(f"  Error: {e}")
+            logger.info(f"  Error: {e}")
         
         result['processing_time'] = time.time() - start_time
         return result
     
-    def run_tests(self, max_tests: int = None, dataset_name: str = "test_claims_wikipedia") -> List[Dict[str, Any]]:
+    def run_tests(self, max_tests: int = None, dataset_name: str = "test_claims_wikipedia",
+                  sequential: bool = False) -> List[Dict[str, Any]]:
         """Run tests on the dataset."""
-        print(f"Loading test dataset: {dataset_name}")
+        logger.info(f"Loading test dataset: {dataset_name}")
         dataset = self.load_test_dataset(dataset_name)
         
         if max_tests:
             dataset = dataset[:max_tests]
         
-        print(f"Running {len(dataset)} tests with full local system...")
+        if not sequential:
+            return self.run_tests_batched(dataset)
+        
+        logger.info(f"Running {len(dataset)} tests sequentially with full local system...")
         
         results = []
         for i, test_data in enumerate(dataset, 1):
-            print(f"\n{'='*60}")
-            print(f"Test {i}/{len(dataset)}")
-            print(f"{'='*60}")
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Test {i}/{len(dataset)}")
+            logger.info(f"{'='*60}")
             
             result = self.test_single_claim(test_data)
             results.append(result)
         
         return results
     
+    def run_tests_batched(self, dataset: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run all tests stage by stage instead of claim by claim:
+        one model batch for Wikipedia queries, concurrent search + scraping,
+        then one model batch for all fact-checks.
+        """
+        logger.info(f"Running {len(dataset)} tests in batches with full local system...")
+        start_time = time.time()
+        
+        results = [self._new_result(test_data) for test_data in dataset]
+        if not results:
+            return results
+        
+        # Phase 1: Get Wikipedia article queries in one batch
+        logger.info(f"\nPhase 1: Getting Wikipedia queries for {len(dataset)} claims...")
+        queries = get_queries_for_wiki_articles([r['claim'] for r in results])
+        for result, article_query in zip(results, queries):
+            result['article_query'] = article_query
+        
+        # Phase 2: Search and scrape for every claim concurrently
+        logger.info("Phase 2: Fetching URLs and scraping content...")
+        contents = asyncio.run(self._search_and_scrape_all(results))
+        
+        # Phase 3: Fact-check everything that has content in one batch
+        pending = [i for i, content in enumerate(contents) if content]
+        logger.info(f"Phase 3: Fact-checking {len(pending)} claims...")
+        answers = find_answers_in_articles([(contents[i], results[i]['claim']) for i in pending])
+        
+        for i, factcheck_result in zip(pending, answers):
+            result = results[i]
+            if factcheck_result:
+                result['predicted_label'] = factcheck_result.label
+                result['evidence'] = factcheck_result.evidence
+                result['is_correct'] = (result['predicted_label'] == result['expected_label'])
+            else:
+                result['error'] = "Failed to get factcheck result"
+        
+        # Stages are shared across tests, so report the amortized time per test
+        per_test_time = (time.time() - start_time) / len(results)
+        for result in results:
+            result['processing_time'] = per_test_time
+            logger.debug(f"  Test {result['test_id']}: Predicted: {result['predicted_label']}, "
+                         f"Expected: {result['expected_label']}, Correct: {result['is_correct']}")
+        
+        return results
+    
+    async def _search_and_scrape_all(self, results: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Search for and scrape the first URL of every result; returns content per result."""
+        url_lists = await asyncio.gather(*[
+            asyncio.to_thread(get_first_n_results_urls, result['article_query'], 1)
+            for result in results
+        ])
+        
+        pending = []
+        for i, (result, urls) in enumerate(zip(results, url_lists)):
+            result['urls'] = urls
+            if urls:
+                pending.append(i)
+            else:
+                result['error'] = "No URLs found"
+        
+        contents: List[Optional[str]] = [None] * len(results)
+        scraped = await scrape_all([url_lists[i][0] for i in pending])
+        for i, content in zip(pending, scraped):
+            if content:
+                contents[i] = content
+            else:
+                results[i]['error'] = "Failed to scrape content"
+        
+        return contents
+    
     def calculate_score(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate accuracy score and other metrics."""
         total_tests = len(results)
@@ -178,27 +268,30 @@ class FullLocalTestRunner:
         }
     
     def print_results(self, results: List[Dict[str, Any]], score: Dict[str, Any]):
-        """Print detailed results."""
-        print(f"\n{'='*60}")
-        print("FULL LOCAL SYSTEM TEST RESULTS")
-        print(f"{'='*60}")
-        print(f"Total Tests: {score['total_tests']}")
-        print(f"Correct: {score['correct_tests']}")
-        print(f"Accuracy: {score['accuracy']:.2%}")
-        print(f"Errors: {score['error_count']}")
-        print(f"Average Processing Time: {score['avg_processing_time']:.2f}s")
-        
-        print(f"\nPer-Label Accuracy:")
-        print(f"True Claims: {score['true_correct_count']}/{score['true_expected_count']} ({score['true_accuracy']:.2%})")
-        print(f"False Claims: {score['false_correct_count']}/{score['false_expected_count']} ({score['false_accuracy']:.2%})")
-        
-        print(f"\nDetailed Results:")
-        print(f"{'ID':<4} {'Expected':<8} {'Predicted':<10} {'Correct':<8} {'Time':<8} {'Error':<20}")
-        print("-" * 70)
+        """Print detailed results as a single log record."""
+        lines = []
+        lines.append(f"\n{'='*60}")
+        lines.append("FULL LOCAL SYSTEM TEST RESULTS")
+        lines.append(f"{'='*60}")
+        lines.append(f"Total Tests: {score['total_tests']}")
+        lines.append(f"Correct: {score['correct_tests']}")
+        lines.append(f"Accuracy: {score['accuracy']:.2%}")
+        lines.append(f"Errors: {score['error_count']}")
+        lines.append(f"Average Processing Time: {score['avg_processing_time']:.2f}s")
+        
+        lines.append(f"\nPer-Label Accuracy:")
+        lines.append(f"True Claims: {score['true_correct_count']}/{score['true_expected_count']} ({score['true_accuracy']:.2%})")
+        lines.append(f"False Claims: {score['false_correct_count']}/{score['false_expected_count']} ({score['false_accuracy']:.2%})")
+        
+        lines.append(f"\nDetailed Results:")
+        lines.append(f"{'ID':<4} {'Expected':<8} {'Predicted':<10} {'Correct':<8} {'Time':<8} {'Error':<20}")
+        lines.append("-" * 70)
         
         for result in sorted(results, key=lambda x: x['test_id']):
             error_str = result['error'][:17] + "..." if result['error'] and len(result['error']) > 20 else (result['error'] or "")
-            print(f"{result['test_id']:<4} {result['expected_label']:<8} {result['predicted_label'] or 'None':<10} {result['is_correct']!s:<8} {result['processing_time']:.2f}s {error_str:<20}")
+            lines.append(f"{result['test_id']:<4} {result['expected_label']:<8} {result['predicted_label'] or 'None':<10} {result['is_correct']!s:<8} {result['processing_time']:.2f}s {error_str:<20}")
+        
+        logger.info("\n".join(lines))
     
     def save_results(self, results: List[Dict[str, Any]], score: Dict[str, Any], output_path: str):
         """Save results to JSON file."""
@@ -210,7 +303,7 @@ class FullLocalTestRunner:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(output_data, f, indent=2, ensure_ascii=False)
         
-        print(f"\nResults saved to: {output_path}")
+        logger.info(f"\nResults saved to: {output_path}")
 
 
 def main():
@@ -223,26 +316,33 @@ def main():
     parser.add_argument('--max-tests', type=int, help='Maximum number of tests to run')
     parser.add_argument('--dataset', default='test_claims_wikipedia', help='Dataset to use (without .jsonl extension)')
     parser.add_argument('--output', help='Save results to JSON file')
+    parser.add_argument('--sequential', action='store_true',
+                        help='Run tests one at a time instead of in batched stages (for comparison)')
+    
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='Show per-step progress (-v) and library debug output (-vv)')
     
     args = parser.parse_args()
+    configure_logging(args.verbose)
     
-    print("Full Local System Test")
-    print("=" * 40)
-    print("This runs the complete original pipeline with local models:")
-    print("1. Extract claims from query")
-    print("2. Optimize claims")
-    print("3. Get Wikipedia article queries")
-    print("4. Search Google for URLs")
-    print("5. Scrape Wikipedia content")
-    print("6. Fact-check using local model")
-    print("7. Compare with expected results")
-    print()
+    logger.info("Full Local System Test")
+    logger.info("=" * 40)
+    logger.info("This runs the complete original pipeline with local models:")
+    logger.info("1. Extract claims from query")
+    logger.info("2. Optimize claims")
+    logger.info("3. Get Wikipedia article queries")
+    logger.info("4. Search Google for URLs")
+    logger.info("5. Scrape Wikipedia content")
+    logger.info("6. Fact-check using local model")
+    logger.info("7. Compare with expected results")
+    logger.info("")
     
     # Create test runner
     runner = FullLocalTestRunner(args.base_url, args.model)
     
     # Run tests
-    results = runner.run_tests(max_tests=args.max_tests, dataset_name=args.dataset)
+    results = runner.run_tests(max_tests=args.max_tests, dataset_name=args.dataset,
+                               sequential=args.sequential)
     
     # Calculate and display results
     score = runner.calculate_score(results)
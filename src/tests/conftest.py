@@ -1,4 +1,3 @@
-import importlib
 import pathlib
 import pytest
 
@@ -19,9 +18,42 @@ class StubOpenAIClient:
             def create(self, **kwargs):
                 return StubOpenAIResponse(self._parent._output_text)
 
+            parse = create
+
         self.responses = _Responses(self)
 
 
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(monkeypatch, tmp_path):
+    from src.utils import llm_cache
+
+    cache = llm_cache.SQLiteCache(tmp_path / "llm_cache.sqlite")
+    monkeypatch.setattr(llm_cache, "get_cache", lambda: cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_wiki_cache(monkeypatch, tmp_path):
+    from src.utils import wikipedia_scraper
+    from src.utils.llm_cache import SQLiteCache
+
+    cache = SQLiteCache(tmp_path / "wiki_cache.sqlite")
+    monkeypatch.setattr(wikipedia_scraper, "get_wiki_cache", lambda: cache)
+    wikipedia_scraper._cached_wiki_title.cache_clear()
+    yield cache
+    wikipedia_scraper._cached_wiki_title.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_search_cache(monkeypatch, tmp_path):
+    from src.utils import google_custom_search
+    from src.utils.llm_cache import SQLiteCache
+
+    cache = SQLiteCache(tmp_path / "search_cache.sqlite")
+    monkeypatch.setattr(google_custom_search, "get_search_cache", lambda: cache)
+    return cache
+
+
 @pytest.fixture
 def stub_openai_client_factory(monkeypatch):
     def _factory(output_text: str | None):
@@ -50,6 +82,6 @@ def tmp_env(monkeypatch, tmp_path):
             import src.utils.config as cfg
 
             monkeypatch.setattr(cfg, "ENV_PATH", self.path, raising=True)
-            importlib.reload(cfg)
+            monkeypatch.setattr(cfg.LazySettings, "_cache", None)
 
     return _Env(tmp_path)
@@ -0,0 +1,20 @@
+from src.utils import claims
+from src.tests.conftest import StubOpenAIClient
+
+
+def test_extract_claims_from_query_uses_claim_list_schema(monkeypatch):
+    monkeypatch.setattr(
+        claims,
+        "get_client",
+        lambda: StubOpenAIClient('{"claims": ["Ada was born in 1815"]}'),
+    )
+    assert claims.extract_claims_from_query("Ada was born in 1815, right?") == [
+        "Ada was born in 1815"
+    ]
+
+
+def test_extract_claims_from_query_rejects_output_outside_schema(monkeypatch):
+    monkeypatch.setattr(
+        claims, "get_client", lambda: StubOpenAIClient('["not", "wrapped"]')
+    )
+    assert claims.extract_claims_from_query("Is the sky blue?") == []
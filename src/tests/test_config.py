@@ -0,0 +1,11 @@
+def test_settings_load_lazily_from_env_file(tmp_env, monkeypatch):
+    monkeypatch.delenv("CUSTOM_SEARCH_API_KEY", raising=False)
+    monkeypatch.delenv("CUSTOM_SEARCH_ENGINE_ID", raising=False)
+    tmp_env.write({"CUSTOM_SEARCH_API_KEY": "key", "CUSTOM_SEARCH_ENGINE_ID": "cx"})
+    tmp_env.reload()
+
+    from src.utils.config import LazySettings, SETTINGS
+
+    assert LazySettings._cache is None
+    assert SETTINGS.custom_search_api_key == "key"
+    assert SETTINGS.custom_search_engine_id == "cx"
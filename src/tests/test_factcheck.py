@@ -0,0 +1,204 @@
+import asyncio
+
+import orjson
+
+from src.utils import factcheck
+from src.utils.constants import PROMPT_FACTCHECK_PREFIX
+
+
+def test_afind_answer_in_article_streams_until_verdict(monkeypatch):
+    class AsyncResponses:
+        async def create(self, model, input, stream):
+            system, user = input
+            # Static instructions lead, dynamic claim + content follow
+            assert system == {"role": "system", "content": PROMPT_FACTCHECK_PREFIX}
+            label = "True" if "Claim A" in user["content"] else "False"
+            return FakeStream(
+                ['{"label": ', f'"{label}", "evidence": "e"}}', " Explanation follows"]
+            )
+
+    class FakeStream:
+        def __init__(self, deltas):
+            self.deltas = deltas
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            pass
+
+        async def __aiter__(self):
+            for delta in self.deltas:
+                # Nothing after the closing brace should be read
+                assert delta != " Explanation follows"
+                yield type(
+                    "Event", (), {"type": "response.output_text.delta", "delta": delta}
+                )
+
+    class AsyncClient:
+        responses = AsyncResponses()
+
+    async def run():
+        return await asyncio.gather(
+            factcheck.afind_answer_in_article(
+                "Text about A.", "Claim A", AsyncClient()
+            ),
+            factcheck.afind_answer_in_article(
+                "Text about B.", "Claim B", AsyncClient()
+            ),
+        )
+
+    assert [r.label for r in asyncio.run(run())] == ["True", "False"]
+
+
+def test_response_output_text_from_batch_body():
+    body = {
+        "output": [
+            {"type": "reasoning", "content": []},
+            {
+                "type": "message",
+                "content": [{"type": "output_text", "text": '{"label": "True"'}],
+            },
+            {
+                "type": "message",
+                "content": [{"type": "output_text", "text": ', "evidence": "e"}'}],
+            },
+        ]
+    }
+    assert factcheck._response_output_text(body) == '{"label": "True", "evidence": "e"}'
+
+
+class FakeBatchClient:
+    """files/batches endpoints of the OpenAI client, completing on the second poll."""
+
+    def __init__(self):
+        self.uploaded = None
+        self.polls = 0
+        client = self
+
+        class Files:
+            def create(self, file, purpose):
+                client.uploaded = file[1]
+                return type("File", (), {"id": "file-in"})
+
+            def content(self, file_id):
+                assert file_id == "file-out"
+                lines = []
+                for line in client.uploaded.splitlines():
+                    request = orjson.loads(line)
+                    claim = request["body"]["input"][1]["content"]
+                    label = "True" if "Claim A" in claim else "False"
+                    body = {
+                        "output": [
+                            {
+                                "type": "message",
+                                "content": [
+                                    {
+                                        "type": "output_text",
+                                        "text": f'{{"label": "{label}", "evidence": "e"}}',
+                                    }
+                                ],
+                            }
+                        ]
+                    }
+                    lines.append(
+                        orjson.dumps(
+                            {
+                                "custom_id": request["custom_id"],
+                                "response": {"status_code": 200, "body": body},
+                            }
+                        )
+                    )
+                # Output order is not guaranteed
+                return type("Content", (), {"content": b"\n".join(reversed(lines))})
+
+        class Batches:
+            def create(self, input_file_id, endpoint, completion_window):
+                assert (input_file_id, endpoint) == ("file-in", "/v1/responses")
+                return type("Batch", (), {"id": "batch-1"})
+
+            def retrieve(self, batch_id):
+                client.polls += 1
+                done = client.polls > 1
+                return type(
+                    "Batch",
+                    (),
+                    {
+                        "status": "completed" if done else "in_progress",
+                        "output_file_id": "file-out" if done else None,
+                    },
+                )
+
+        self.files = Files()
+        self.batches = Batches()
+
+
+def test_factcheck_batch_round_trip(monkeypatch):
+    client = FakeBatchClient()
+    monkeypatch.setattr(factcheck, "get_client", lambda: client)
+    pairs = [("Text about A.", "Claim A"), ("Text about B.", "Claim B")]
+
+    batch_id = factcheck.submit_factcheck_batch(pairs)
+    results = factcheck.collect_factcheck_batch(batch_id, len(pairs), poll_interval=0)
+    assert [r.label for r in results] == ["True", "False"]
+    assert client.polls == 2
+
+
+def test_afind_answer_in_article_keeps_blocking_work_off_the_loop(
+    monkeypatch, isolated_llm_cache
+):
+    import threading
+
+    threads = {}
+
+    def recording(name, fn):
+        def wrapper(*args):
+            threads.setdefault(name, threading.get_ident())
+            return fn(*args)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        factcheck, "bm25_topk", recording("bm25", lambda content, claim: content)
+    )
+    monkeypatch.setattr(
+        isolated_llm_cache, "get", recording("cache_get", isolated_llm_cache.get)
+    )
+    monkeypatch.setattr(
+        isolated_llm_cache, "set", recording("cache_set", isolated_llm_cache.set)
+    )
+
+    class Stream:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            pass
+
+        async def __aiter__(self):
+            yield type(
+                "Event",
+                (),
+                {
+                    "type": "response.output_text.delta",
+                    "delta": '{"label": "True", "evidence": "e"}',
+                },
+            )
+
+    class AsyncResponses:
+        async def create(self, model, input, stream):
+            return Stream()
+
+    class AsyncClient:
+        responses = AsyncResponses()
+
+    async def run():
+        result = await factcheck.afind_answer_in_article(
+            "Text.", "Claim", AsyncClient()
+        )
+        return result, threading.get_ident()
+
+    result, loop_thread = asyncio.run(run())
+    assert result.label == "True"
+    assert set(threads) == {"bm25", "cache_get", "cache_set"}
+    assert loop_thread not in threads.values()
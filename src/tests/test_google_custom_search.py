@@ -1,16 +1,62 @@
 def test_get_first_n_results_urls(monkeypatch):
     from src.utils import google_custom_search as gcs
 
+    calls = []
+
     def fake_get(url, params=None, timeout=None):
+        calls.append(params)
+
         class Resp:
-            def json(self):
-                return {"items": [{"link": "http://a"}, {"link": "http://b"}]}
+            content = b'{"items": [{"link": "http://a"}, {"link": "http://b"}]}'
 
             def raise_for_status(self):
                 pass
 
         return Resp()
 
-    monkeypatch.setattr(gcs.requests, "get", fake_get)
+    class FakeSession:
+        get = staticmethod(fake_get)
+
+    monkeypatch.setattr(gcs, "get_session", lambda: FakeSession())
     urls = gcs.get_first_n_results_urls("Ada", n=1)
     assert urls == ["http://a"]
+    assert (calls[0]["num"], calls[0]["fields"]) == (1, "items(link)")
+    # Repeat searches are served from the cache
+    assert gcs.get_first_n_results_urls("Ada", n=1) == ["http://a"]
+    assert len(calls) == 1
+
+
+def test_search_cache_is_keyed_on_engine(monkeypatch):
+    from src.utils import google_custom_search as gcs
+    from src.utils.config import LazySettings
+
+    engine = gcs.SETTINGS.custom_search_engine_id
+    key = gcs._cache_key("Ada", 1)
+    monkeypatch.setattr(
+        LazySettings,
+        "_cache",
+        LazySettings._cache.model_copy(
+            update={"custom_search_engine_id": engine + "-other"}
+        ),
+    )
+    assert gcs._cache_key("Ada", 1) != key
+
+
+def test_aget_first_n_results_urls():
+    import asyncio
+
+    import httpx
+
+    from src.utils import google_custom_search as gcs
+
+    def handler(request):
+        assert request.url.params["q"] == "Ada"
+        return httpx.Response(
+            200, json={"items": [{"link": "http://a"}, {"link": "http://b"}]}
+        )
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await gcs.aget_first_n_results_urls(client, "Ada", n=2)
+
+    assert asyncio.run(run()) == ["http://a", "http://b"]
@@ -0,0 +1,14 @@
+from src.utils.json_stream import JSONObjectWatcher
+
+
+def test_watcher_stops_after_object_with_key():
+    watcher = JSONObjectWatcher("label")
+    assert not watcher.feed('Note {x} then {"evidence": "a } in {text", ')
+    assert watcher.feed('"label": "True"} and more')
+    assert watcher.text.endswith("} and more")
+
+
+def test_watcher_ignores_objects_without_key():
+    watcher = JSONObjectWatcher("label")
+    assert not watcher.feed('{"other": 1}')
+    assert watcher.feed(' {"label": "False", "nested": {"a": "\\"}"}}')
@@ -0,0 +1,38 @@
+from src.utils.links import build_text_fragment_link
+
+
+def test_short_evidence_is_linked_verbatim():
+    link = build_text_fragment_link("https://x/wiki/A", "Born in 1815, London")
+    assert link == "https://x/wiki/A#:~:text=Born%20in%201815%2C%20London"
+    assert build_text_fragment_link("https://x/wiki/A", None) == "https://x/wiki/A"
+
+
+def test_long_evidence_becomes_whole_word_range():
+    evidence = "Alpha beta gamma " * 20 + "the final words"
+    link = build_text_fragment_link("https://x/wiki/A", evidence)
+    start, end = link.split("#:~:text=")[1].split(",")
+    assert len(link) < 200
+    assert start.startswith("Alpha%20beta") and not start.endswith("%20")
+    assert end.endswith("the%20final%20words")
+    # Cuts land between words
+    for part in (start, end):
+        assert all(
+            word in ("Alpha", "beta", "gamma", "the", "final", "words")
+            for word in part.split("%20")
+        )
+
+
+def test_hyphens_are_escaped_so_they_are_not_read_as_prefix_or_suffix():
+    link = build_text_fragment_link("https://x/wiki/A", "Anglo-French war")
+    assert link == "https://x/wiki/A#:~:text=Anglo%2DFrench%20war"
+
+    evidence = (
+        "Franco-Prussian " + "war " * 40 + "ended with the Treaty of Frankfurt-am-Main"
+    )
+    start, end = (
+        build_text_fragment_link("https://x/wiki/A", evidence)
+        .split("#:~:text=")[1]
+        .split(",")
+    )
+    assert start.startswith("Franco%2DPrussian%20war")
+    assert end.endswith("Frankfurt%2Dam%2DMain") and "-" not in start + end
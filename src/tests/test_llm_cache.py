@@ -0,0 +1,60 @@
+from src.utils import llm_cache
+
+
+def test_cached_memoizes_by_model_and_prompt(isolated_llm_cache):
+    calls = []
+
+    @llm_cache.cached
+    def fake_llm(model, prompt):
+        calls.append((model, prompt))
+        return f"{model}:{prompt}"
+
+    assert fake_llm("m1", "p") == "m1:p"
+    assert fake_llm("m1", "p") == "m1:p"
+    assert fake_llm("m2", "p") == "m2:p"
+    assert calls == [("m1", "p"), ("m2", "p")]
+
+
+def test_cached_skips_empty_responses(isolated_llm_cache):
+    calls = []
+
+    @llm_cache.cached
+    def fake_llm(model, prompt):
+        calls.append(prompt)
+        return None
+
+    fake_llm("m", "p")
+    fake_llm("m", "p")
+    assert len(calls) == 2
+
+
+def test_sqlite_cache_ttl(tmp_path, monkeypatch):
+    cache = llm_cache.SQLiteCache(tmp_path / "c.sqlite", ttl=10)
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    now = llm_cache.time.time()
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now + 60)
+    assert cache.get("k") is None
+
+
+def test_sqlite_cache_memory_front_is_bounded(tmp_path):
+    cache = llm_cache.SQLiteCache(tmp_path / "c.sqlite", memory_size=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+    assert list(cache._memory) == ["b", "c"]
+    # Evicted entries are still served from disk and re-enter memory
+    assert cache.get("a") == "A"
+    assert list(cache._memory) == ["c", "a"]
+
+
+def test_sqlite_cache_prunes_expired_rows_on_open(tmp_path, monkeypatch):
+    path = tmp_path / "c.sqlite"
+    cache = llm_cache.SQLiteCache(path, ttl=10)
+    cache.set("old", "v")
+    now = llm_cache.time.time()
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now + 60)
+    cache.set("new", "v")
+
+    reopened = llm_cache.SQLiteCache(path, ttl=10)
+    keys = [row[0] for row in reopened._connect().execute("SELECT key FROM cache")]
+    assert keys == ["new"]
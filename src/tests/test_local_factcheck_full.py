@@ -0,0 +1,42 @@
+from src.utils import local_factcheck_full
+from src.utils import local_openai_client as loc
+
+
+def test_find_answer_in_article_ranks_and_budgets_bm25_candidates(monkeypatch):
+    client = loc.LocalOpenAIClient()
+    selections = []
+    select = client._select_relevant_content
+
+    def spy_select(claim, content, *args, **kwargs):
+        selected = select(claim, content, *args, **kwargs)
+        selections.append((content, selected))
+        return selected
+
+    monkeypatch.setattr(client, "_select_relevant_content", spy_select)
+    monkeypatch.setattr(
+        client,
+        "_make_request",
+        lambda prompt, **kwargs: '{"label": "True", "evidence": "1943"}',
+    )
+    monkeypatch.setattr(local_factcheck_full, "get_local_openai_client", lambda: client)
+
+    filler = [
+        f"Section {i} describes the regional geography, seasonal weather patterns and "
+        "agricultural output of several distant mountain provinces."
+        for i in range(300)
+    ]
+    relevant = "Lebanon gained its independence from France in 1943."
+    article = " ".join(filler[:150] + [relevant] + filler[150:])
+
+    result = local_factcheck_full.find_answer_in_article(
+        article, "Lebanon became independent in 1943"
+    )
+    assert result.label == "True"
+
+    ((candidates, selected),) = selections
+    # BM25 candidates reach the client as separate paragraphs, over the token budget
+    assert candidates.count("\n\n") == local_factcheck_full.CANDIDATE_SENTENCES - 1
+    assert loc.estimate_tokens(candidates) > loc.MAX_CONTENT_TOKENS
+    # ... and the client's ranking and budget trim them
+    assert loc.estimate_tokens(selected) <= loc.MAX_CONTENT_TOKENS
+    assert relevant in selected
@@ -0,0 +1,311 @@
+import orjson
+
+from src.utils import local_openai_client as loc
+
+
+def test_batch_responses_orders_by_index(monkeypatch):
+    class FakeHttp:
+        def post(self, url, content=None, headers=None, timeout=None):
+            assert url.endswith("/v1/completions")
+            assert orjson.loads(content)["prompt"] == ["p0", "p1"]
+
+            class Resp:
+                content = orjson.dumps(
+                    {"choices": [{"index": 1, "text": "b"}, {"index": 0, "text": "a"}]}
+                )
+
+                def raise_for_status(self):
+                    pass
+
+            return Resp()
+
+    client = loc.LocalOpenAIClient()
+    client._http = FakeHttp()
+    assert client.batch_responses(["p0", "p1"]) == ["a", "b"]
+
+
+def test_batch_responses_falls_back_per_prompt(monkeypatch):
+    client = loc.LocalOpenAIClient()
+
+    def failing_post(prompts, *a):
+        raise RuntimeError("list prompts not supported")
+
+    monkeypatch.setattr(client, "post_completion", failing_post)
+
+    async def fake_request(http, prompt, *a):
+        return prompt.upper()
+
+    monkeypatch.setattr(client, "_amake_request", fake_request)
+    assert client.batch_responses(["p0", "p1"]) == ["P0", "P1"]
+
+
+def test_batch_responses_caches_fallback_results(monkeypatch):
+    client = loc.LocalOpenAIClient()
+    sent = []
+
+    def failing_post(prompts, *a):
+        raise RuntimeError("list prompts not supported")
+
+    async def fake_request(http, prompt, *a):
+        sent.append(prompt)
+        return prompt.upper()
+
+    monkeypatch.setattr(client, "post_completion", failing_post)
+    monkeypatch.setattr(client, "_amake_request", fake_request)
+    assert client.batch_responses(["p0"]) == ["P0"]
+    assert client.batch_responses(["p0"]) == ["P0"]
+    assert sent == ["p0"]
+
+
+def test_get_wiki_article_names_falls_back_to_claim(monkeypatch):
+    client = loc.LocalOpenAIClient()
+    monkeypatch.setattr(client, "batch_responses", lambda prompts, **kw: ["Moon", None])
+    assert client.get_wiki_article_names(["The moon is round", "Water is wet"]) == [
+        "Moon",
+        "Water is wet",
+    ]
+
+
+def test_optimize_claims_batches_semantic_cache_misses(monkeypatch):
+    client = loc.LocalOpenAIClient()
+    client._semantic_cache.set(
+        "optimize_claim", "Ada was born in 1815", "Ada Lovelace was born in 1815"
+    )
+    batches = []
+
+    def fake_batch(prompts, **kw):
+        batches.append(prompts)
+        return ["The Moon is spherical", None]
+
+    monkeypatch.setattr(client, "batch_responses", fake_batch)
+    claims = ["ada was born in 1815.", "The moon is round", "Water is wet"]
+    assert client.optimize_claims(claims) == [
+        "Ada Lovelace was born in 1815",
+        "The Moon is spherical",
+        "Water is wet",
+    ]
+    assert len(batches) == 1 and len(batches[0]) == 2
+
+
+def test_batch_responses_drops_rejected_response_format(monkeypatch):
+    import httpx
+
+    sent = []
+
+    class FakeHttp:
+        def post(self, url, content=None, headers=None, timeout=None):
+            payload = orjson.loads(content)
+            sent.append("response_format" in payload)
+            request = httpx.Request("POST", url)
+            if "response_format" in payload:
+                return httpx.Response(400, request=request)
+            return httpx.Response(
+                200,
+                request=request,
+                content=orjson.dumps({"choices": [{"index": 0, "text": "ok"}]}),
+            )
+
+    client = loc.LocalOpenAIClient()
+    client._http = FakeHttp()
+    fmt = {"type": "json_schema", "json_schema": {"name": "x", "schema": {}}}
+    assert client.batch_responses(["p0"], response_format=fmt) == ["ok"]
+    assert client.batch_responses(["p1"], response_format=fmt) == ["ok"]
+    # Rejected once, then never sent again
+    assert sent == [True, False, False]
+
+
+def test_batch_responses_only_sends_cache_misses(monkeypatch):
+    client = loc.LocalOpenAIClient()
+    sent = []
+
+    def fake_post(prompts, *a):
+        sent.append(list(prompts))
+        return [p.upper() for p in prompts]
+
+    monkeypatch.setattr(client, "_post_chunk", fake_post)
+    assert client.batch_responses(["p0", "p1"]) == ["P0", "P1"]
+    assert client.batch_responses(["p1", "p2"]) == ["P1", "P2"]
+    # Sampled responses are never served from the cache
+    assert client.batch_responses(["p2"], temperature=0.7) == ["P2"]
+    assert sent == [["p0", "p1"], ["p2"], ["p2"]]
+
+
+def test_select_relevant_content_ranks_paragraphs_by_claim():
+    client = loc.LocalOpenAIClient()
+    filler = [
+        f"Paragraph {i} describes unrelated geography and weather." for i in range(40)
+    ]
+    relevant = "Lebanon gained its independence from France in 1943."
+    content = "\n\n".join(filler[:20] + [relevant] + filler[20:])
+    selected = client._select_relevant_content(
+        "Lebanon became independent in 1943", content, max_tokens=50
+    )
+    assert relevant in selected
+
+
+def test_select_relevant_content_indexes_each_article_once(monkeypatch):
+    built = []
+
+    class CountingIndex(loc.BM25Index):
+        def __init__(self, docs):
+            built.append(len(docs))
+            super().__init__(docs)
+
+    monkeypatch.setattr(loc, "BM25Index", CountingIndex)
+    client = loc.LocalOpenAIClient()
+    content = "\n\n".join(
+        f"Paragraph {i} about the history of Lebanon." for i in range(100)
+    )
+    loc._split_and_index.cache_clear()
+    client._select_relevant_content(
+        "Lebanon became independent in 1943", content, max_tokens=80
+    )
+    client._select_relevant_content(
+        "Beirut is the capital of Lebanon", content, max_tokens=80
+    )
+    info = loc._split_and_index.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+    # The BM25 statistics are part of the memoized index, not rebuilt per claim
+    assert built == [100]
+
+
+def test_find_json_handles_nested_and_escaped_brackets():
+    text = 'Sure! {"label": "True", "evidence": "He said \\"{x}\\" in [1843]"} done'
+    assert loc._find_json(text, "{") == {
+        "label": "True",
+        "evidence": 'He said "{x}" in [1843]',
+    }
+    assert loc._find_json('Claims: [not json] ["A", ["B"]]', "[") == ["A", ["B"]]
+    assert loc._find_json("no json here", "{") is None
+    assert loc._find_json(' {"label": "False", "evidence": ""}\n', "{") == {
+        "label": "False",
+        "evidence": "",
+    }
+
+
+def test_factcheck_claim_streams_until_verdict_closes(monkeypatch):
+    import httpx
+
+    def handler(request):
+        assert orjson.loads(request.content)["stream"] is True
+        deltas = ['{"label": "True",', ' "evidence": "1943"}', " Because..."]
+        body = (
+            "".join(
+                f"data: {orjson.dumps({'choices': [{'delta': {'content': d}}]}).decode()}\n\n"
+                for d in deltas
+            )
+            + "data: [DONE]\n\n"
+        )
+        return httpx.Response(200, text=body)
+
+    client = loc.LocalOpenAIClient()
+    client._http = httpx.Client(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    result = client.factcheck_claim(
+        "Lebanon became independent in 1943", "Independence in 1943."
+    )
+    assert result == {"label": "True", "evidence": "1943"}
+    # Nothing after the closing brace was read (or cached)
+    assert (
+        client._make_request(
+            client._factcheck_prompt(
+                "Lebanon became independent in 1943", "Independence in 1943."
+            ),
+            stop_at_key="label",
+        )
+        == '{"label": "True", "evidence": "1943"}'
+    )
+
+
+def test_extract_claims_requests_claim_list_schema(monkeypatch):
+    client = loc.LocalOpenAIClient()
+    calls = []
+
+    def fake_request(prompt, max_tokens=1000, temperature=0.1, response_format=None):
+        calls.append(response_format)
+        return (
+            '{"claims": ["Ada was born in 1815"]}'
+            if response_format
+            else '["Ada was born in 1815"]'
+        )
+
+    monkeypatch.setattr(client, "_make_request", fake_request)
+    assert client._extract_claims("Ada was born in 1815?") == ["Ada was born in 1815"]
+    client.supports_response_format = False
+    assert client._extract_claims("Ada was born in 1815?") == ["Ada was born in 1815"]
+    assert calls == [loc.CLAIM_LIST_RESPONSE_FORMAT, None]
+
+
+def test_extract_claims_drops_non_string_and_blank_items(monkeypatch):
+    client = loc.LocalOpenAIClient()
+    client.supports_response_format = False
+    monkeypatch.setattr(
+        client,
+        "_make_request",
+        lambda prompt, **kw: '["  Ada was born in 1815 ", null, 1815, "", "   "]',
+    )
+    assert client._extract_claims("Ada was born in 1815?") == ["Ada was born in 1815"]
+
+
+def test_key_terms_rank_paragraph_with_claim_year_and_name_first():
+    claim = "In 1943, Lebanon (not Syria) left France; Lebanon was free."
+    assert loc._key_terms(claim) == ["1943", "lebanon", "syria", "france"]
+
+    client = loc.LocalOpenAIClient()
+    target = "Lebanon left France in 1943."
+    paragraphs = [f"Paragraph {i} was free of notable events." for i in range(30)]
+    content = "\n\n".join(paragraphs[:15] + [target] + paragraphs[15:])
+    # Budget for exactly one paragraph: only the top-ranked one is kept
+    selected = client._select_relevant_content(
+        claim, content, max_tokens=loc.estimate_tokens(target)
+    )
+    assert selected.strip() == target
+
+
+def test_select_relevant_content_budgets_tokens_not_characters():
+    client = loc.LocalOpenAIClient()
+    # URL-heavy text is short in characters but long in tokens
+    urls = "\n\n".join(
+        f"See https://example.org/a/b/c?id={i}&x=1 for Lebanon" for i in range(50)
+    )
+    selected = client._select_relevant_content("Lebanon", urls, max_tokens=100)
+    assert loc.estimate_tokens(selected) <= 100
+    assert len(urls) < 8000
+    assert loc.estimate_tokens("Independence") == 2
+    assert loc._truncate_tokens("one two three", 2) == "one two"
+
+
+def test_make_request_keys_cache_on_request_options(monkeypatch):
+    client = loc.LocalOpenAIClient()
+    sent = []
+
+    def fake_request(prompt, max_tokens, temperature, response_format):
+        sent.append((max_tokens, response_format))
+        return f"text {len(sent)}"
+
+    monkeypatch.setattr(client, "_request_chat", fake_request)
+    fmt = {"type": "json_schema", "json_schema": {"name": "x", "schema": {}}}
+    assert client._make_request("p") == "text 1"
+    assert client._make_request("p") == "text 1"
+    # Constrained and shorter outputs are separate entries
+    assert client._make_request("p", response_format=fmt) == "text 2"
+    assert client._make_request("p", max_tokens=10) == "text 3"
+    assert sent == [(1000, None), (1000, fmt), (10, None)]
+
+
+def test_context_length_error_keeps_response_format(monkeypatch):
+    import httpx
+
+    def handler(request):
+        return httpx.Response(
+            400, json={"error": "prompt exceeds the context length (4096 tokens)"}
+        )
+
+    client = loc.LocalOpenAIClient()
+    client._http = httpx.Client(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    fmt = {"type": "json_schema", "json_schema": {"name": "x", "schema": {}}}
+    assert client._make_request("p" * 100, response_format=fmt) is None
+    assert client.supports_response_format is True
@@ -0,0 +1,64 @@
+from src import main
+from src.utils.models import ClaimResult
+
+
+def test_batch_flag_fact_checks_through_batch_api(monkeypatch, caplog):
+    import logging
+
+    submitted = []
+    monkeypatch.setattr(
+        main, "extract_claims_from_query", lambda query: ["Claim A", "Claim B"]
+    )
+    monkeypatch.setattr(main, "get_query_for_wiki_article", lambda claim: claim)
+    monkeypatch.setattr(
+        main,
+        "get_first_n_results_urls",
+        lambda query, n: None if query == "Claim B" else ["https://w/A"],
+    )
+    monkeypatch.setattr(main, "scrape_wikipedia_content", lambda url: "Text about A.")
+    monkeypatch.setattr(
+        main,
+        "submit_factcheck_batch",
+        lambda pairs: submitted.append(pairs) or "batch-1",
+    )
+    monkeypatch.setattr(
+        main,
+        "collect_factcheck_batch",
+        lambda batch_id, n, poll_interval: (
+            [ClaimResult(label="True", evidence="about A")] * n
+        ),
+    )
+    monkeypatch.setattr(main, "configure_logging", lambda verbosity: None)
+    caplog.set_level(logging.INFO, logger=main.__name__)
+
+    assert main.main(["--batch", "A and B"]) == 0
+    assert submitted == [[("Text about A.", "Claim A")]]
+    assert "No URL found from search" in caplog.text
+    assert "Label: True" in caplog.text
+
+
+def test_aprocess_claims_shares_one_scrape_session(monkeypatch):
+    import asyncio
+
+    sessions = []
+
+    async def fake_scrape_all(urls, session=None):
+        sessions.append(session)
+        return [f"text {url}" for url in urls]
+
+    async def fake_search(http, query, n):
+        return [f"https://w/{query}"]
+
+    async def fake_factcheck(content, claim, client):
+        return ClaimResult(label="True", evidence=claim)
+
+    monkeypatch.setattr(main, "get_query_for_wiki_article", lambda claim: claim)
+    monkeypatch.setattr(main, "aget_first_n_results_urls", fake_search)
+    monkeypatch.setattr(main, "scrape_all", fake_scrape_all)
+    monkeypatch.setattr(main, "afind_answer_in_article", fake_factcheck)
+    monkeypatch.setattr(main, "get_async_client", lambda: None)
+
+    results = asyncio.run(main.aprocess_claims(["A", "B", "C"], 1))
+    assert [r["result"].label for r in results] == ["True"] * 3
+    assert len(sessions) == 3 and sessions[0] is not None
+    assert all(session is sessions[0] for session in sessions)
@@ -0,0 +1,77 @@
+import asyncio
+
+from src import main_local
+
+
+def test_scrape_and_factcheck_batches_finished_scrapes(monkeypatch):
+    async def fake_fetch(article_query, top_n_urls=1):
+        await asyncio.sleep(0.05 if article_query == "slow" else 0)
+        contents = (
+            [] if article_query == "missing" else [("url", f"text {article_query}")]
+        )
+        return {"urls": ["url"], "contents": contents, "url_time": 0, "scrape_time": 0}
+
+    batches = []
+
+    def fake_factcheck(pairs):
+        batches.append([claim for _content, claim in pairs])
+        return [f"checked {claim}" for _content, claim in pairs]
+
+    monkeypatch.setattr(main_local, "asearch_and_scrape", fake_fetch)
+    monkeypatch.setattr(main_local, "find_answers_in_articles", fake_factcheck)
+
+    fetched, answers, times = asyncio.run(
+        main_local.scrape_and_factcheck(["a", "b", "c"], ["fast", "missing", "slow"])
+    )
+    # The fast scrape is checked without waiting for the slow one
+    assert batches == [["a"], ["c"]]
+    assert answers == {0: "checked a", 2: "checked c"}
+    assert fetched[1]["contents"] == [] and set(times) == {0, 2}
+
+
+def test_get_article_queries_do_not_depend_on_verbosity(monkeypatch, caplog):
+    import logging
+
+    monkeypatch.setattr(
+        main_local,
+        "get_queries_for_wiki_articles",
+        lambda claims: [f"q {c}" for c in claims],
+    )
+    batches = []
+
+    def fake_optimize(claims):
+        batches.append(list(claims))
+        return [f"opt {c}" for c in claims]
+
+    monkeypatch.setattr(main_local, "optimize_claims", fake_optimize)
+
+    caplog.set_level(logging.INFO, logger=main_local.__name__)
+    quiet = main_local.get_article_queries(["a", "b"])
+    caplog.set_level(logging.DEBUG, logger=main_local.__name__)
+    verbose = main_local.get_article_queries(["a", "b"])
+
+    assert quiet == [(None, "q a"), (None, "q b")]
+    assert verbose == [("opt a", "q a"), ("opt b", "q b")]
+    # At -v all claims are optimized in one batch, not one call each
+    assert batches == [["a", "b"]]
+
+
+def test_claim_block_reports_why_nothing_was_checked(monkeypatch, caplog):
+    import logging
+
+    monkeypatch.setattr(
+        main_local, "get_article_queries", lambda claims: [(None, "Ada")]
+    )
+    monkeypatch.setattr(
+        main_local,
+        "search_and_scrape",
+        lambda query, top_n: {
+            "urls": ["u"],
+            "contents": [],
+            "url_time": 0,
+            "scrape_time": 0,
+        },
+    )
+    caplog.set_level(logging.INFO, logger=main_local.__name__)
+    main_local.process_single_claim("Ada was born in 1815")
+    assert "Failed to scrape content from any URL" in caplog.text
@@ -7,9 +7,9 @@ def test_rootmodel_parsing():
 
 
 def test_prompt_factcheck_safe():
-    from src.utils.constants import PROMPT_FACTCHECK
+    from src.utils.prompts import factcheck_prompt
 
-    s = PROMPT_FACTCHECK.format(claim="Ada", scraped="Scraped text")
+    s = factcheck_prompt("Ada", "Scraped {text}")
     assert '{"label": "True" or "False"' in s
     assert "Ada" in s
-    assert "Scraped text" in s
+    assert "Scraped {text}" in s
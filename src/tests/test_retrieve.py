@@ -0,0 +1,69 @@
+from src.utils import retrieve
+
+
+def test_bm25_topk_keeps_relevant_sentences_in_order():
+    filler = " ".join(f"Filler sentence number {i} about nothing." for i in range(50))
+    content = (
+        "Ada Lovelace was an English mathematician. "
+        + filler
+        + " Lovelace published the first algorithm in 1843."
+    )
+    out = retrieve.bm25_topk(
+        content, "Did Ada Lovelace publish the first algorithm?", k=2
+    )
+    assert out.split("\n\n") == [
+        "Ada Lovelace was an English mathematician.",
+        "Lovelace published the first algorithm in 1843.",
+    ]
+
+
+def test_bm25_topk_short_content_unchanged():
+    content = "One sentence. Two sentences."
+    assert retrieve.bm25_topk(content, "anything", k=5) == content
+
+
+def test_bm25_topk_accepts_sentence_list():
+    sentences = ["Paris is in France.", "Bananas are yellow.", "Berlin is in Germany."]
+    assert (
+        retrieve.bm25_topk(sentences, "Is Paris in France?", k=1)
+        == "Paris is in France."
+    )
+
+
+def test_bm25_topk_many_matches_single_calls(monkeypatch):
+    monkeypatch.setattr(retrieve, "PROCESS_POOL_MIN_CHARS", 100)
+    article = (
+        " ".join(f"Sentence {i} is filler." for i in range(40)) + " Ada wrote programs."
+    )
+    pairs = [(article, "Ada programs"), ("Short text.", "Ada")]
+    assert retrieve.bm25_topk_many(pairs, k=2) == [
+        retrieve.bm25_topk(content, claim, k=2) for content, claim in pairs
+    ]
+
+
+def test_bm25_scores_rank_docs_by_query_terms():
+    index = retrieve.BM25Index(
+        [
+            ["ada", "wrote", "programs"],
+            ["bananas", "yellow"],
+            ["ada", "ada", "lovelace"],
+        ]
+    )
+    scores = retrieve.bm25_scores(["ada", "lovelace"], index)
+    assert scores[1] == 0.0
+    assert scores[2] > scores[0] > 0.0
+
+
+def test_bm25_topk_splits_and_indexes_each_article_once():
+    from src.utils.wikipedia_scraper import split_sentences
+
+    article = (
+        " ".join(f"Sentence {i} is filler." for i in range(40)) + " Ada wrote programs."
+    )
+    split_sentences.cache_clear()
+    retrieve._index_sentences.cache_clear()
+    retrieve.bm25_topk(article, "Ada programs", k=2)
+    retrieve.bm25_topk(article, "Filler sentence", k=2)
+    assert split_sentences.cache_info().misses == 1
+    info = retrieve._index_sentences.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
@@ -0,0 +1,45 @@
+from src.utils.semantic_cache import SemanticCache
+
+
+def test_semantic_cache_reuses_formatting_variants_only():
+    cache = SemanticCache()
+    cache.set("extract_claims", "Ada Lovelace was born in 1815.", ("A",))
+
+    assert cache.get("extract_claims", "ada lovelace  was born in 1815") == ("A",)
+    assert cache.get("extract_claims", "Ada Lovelace was born in 1815!") == ("A",)
+    # Different word order, numbers, negations or namespaces never match
+    assert cache.get("extract_claims", "In 1815, Ada Lovelace was born") is None
+    assert cache.get("extract_claims", "Ada Lovelace was born in 1816.") is None
+    assert cache.get("extract_claims", "Ada Lovelace was not born in 1815.") is None
+    assert cache.get("optimize_claim", "Ada Lovelace was born in 1815.") is None
+
+
+def test_semantic_cache_keeps_swapped_entities_apart():
+    cache = SemanticCache()
+    cache.set("extract_claims", "Paris is the capital of France", ("Paris",))
+    assert cache.get("extract_claims", "France is the capital of Paris") is None
+
+    passage = (
+        "CITY is a large city with many museums, parks, bridges and old churches. " * 5
+    )
+    cache.set("extract_claims", passage.replace("CITY", "Paris"), ("Paris claims",))
+    assert cache.get("extract_claims", passage.replace("CITY", "London")) is None
+
+
+def test_semantic_cache_keeps_pronouns():
+    cache = SemanticCache()
+    cache.set("optimize_claim", "He won the Nobel Prize in 1903", "He won")
+    assert cache.get("optimize_claim", "She won the Nobel Prize in 1903") is None
+
+
+def test_semantic_cache_keeps_meaningful_punctuation():
+    cache = SemanticCache()
+    for cached, other in [("3.5", "3-5"), ("-5", "5"), ("C++", "C"), ("2:1", "2-1")]:
+        cache.set("optimize_claim", f"The score was {cached} in the final", cached)
+        assert (
+            cache.get("optimize_claim", f"The score was {other} in the final") is None
+        )
+        assert (
+            cache.get("optimize_claim", f"the score was {cached} in the final.")
+            == cached
+        )
@@ -24,3 +24,47 @@ def test_scraper_generic(monkeypatch):
     monkeypatch.setattr(ws, "_generic_html_scrape", lambda url: "Generic")
     out = ws.scrape_wikipedia_content("https://example.com/page")
     assert out == "Generic"
+
+
+def test_scrape_all_preserves_order(monkeypatch):
+    import asyncio
+
+    async def fake_scrape(session, url):
+        await asyncio.sleep(0.01 if url.endswith("a") else 0)
+        return url.upper()
+
+    monkeypatch.setattr(ws, "_scrape_async", fake_scrape)
+    out = asyncio.run(ws.scrape_all(["https://x/a", "https://x/b"]))
+    assert out == ["HTTPS://X/A", "HTTPS://X/B"]
+
+
+def test_split_sentences_keeps_abbreviations_together():
+    text = (
+        "Dr. Smith moved to St. Louis in 1843. He left the U.S. Army later.\n\nHeading"
+    )
+    assert ws.split_sentences(text) == (
+        "Dr. Smith moved to St. Louis in 1843.",
+        "He left the U.S. Army later.",
+        "Heading",
+    )
+
+
+def test_scraper_caches_by_normalized_title(monkeypatch):
+    calls = []
+
+    def fake_plain(title):
+        calls.append(title)
+        return "Plain text"
+
+    monkeypatch.setattr(ws, "_wiki_rest_plain_text", fake_plain)
+    assert (
+        ws.scrape_wikipedia_content("https://en.wikipedia.org/wiki/ada_Lovelace")
+        == "Plain text"
+    )
+    ws._cached_wiki_title.cache_clear()
+    # Served from the on-disk cache under the same normalized title
+    assert (
+        ws.scrape_wikipedia_content("https://en.wikipedia.org/wiki/Ada%20Lovelace")
+        == "Plain text"
+    )
+    assert calls == ["Ada_Lovelace"]
@@ -1,47 +1,90 @@
+import logging
+
+from pydantic import ValidationError
+
 from .openai_client import get_client
 from .constants import (
     MODEL_CLAIM_EXTRACTION,
     MODEL_CLAIM_OPTIMIZATION,
     MODEL_WIKI_TARGET,
-    PROMPT_EXTRACT_CLAIMS,
-    PROMPT_OPTIMIZE_CLAIM,
-    PROMPT_WIKI_ARTICLE_NAME,
+    PROMPT_EXTRACT_CLAIMS_PREFIX,
+    PROMPT_OPTIMIZE_CLAIM_PREFIX,
+    PROMPT_WIKI_ARTICLE_NAME_PREFIX,
 )
-from .models import ExtractedClaims
+from .llm_cache import cached
+from .prompts import (
+    extract_claims_input,
+    messages,
+    optimize_claim_input,
+    wiki_article_name_input,
+)
+from .models import ClaimList
 
+logger = logging.getLogger(__name__)
 
-def extract_claims_from_query(query: str) -> list[str]:
+
+@cached
+def _output_text(model: str, instructions: str, user_input: str) -> str | None:
+    client = get_client()
+    resp = client.responses.create(
+        model=model, input=messages(instructions, user_input)
+    )
+    return getattr(resp, "output_text", None)
+
+
+@cached
+def _claim_list_text(model: str, instructions: str, user_input: str) -> str | None:
+    # Structured outputs constrain decoding to the ClaimList schema, so the text always parses
     client = get_client()
-    prompt = PROMPT_EXTRACT_CLAIMS.format(query=query)
+    resp = client.responses.parse(
+        model=model, input=messages(instructions, user_input), text_format=ClaimList
+    )
+    return getattr(resp, "output_text", None)
+
+
+def extract_claims_from_query(query: str) -> list[str]:
     try:
-        resp = client.responses.create(model=MODEL_CLAIM_EXTRACTION, input=prompt)
-        raw = getattr(resp, "output_text", None)
+        raw = _claim_list_text(
+            MODEL_CLAIM_EXTRACTION,
+            PROMPT_EXTRACT_CLAIMS_PREFIX,
+            extract_claims_input(query),
+        )
         if not raw:
             return []
-        # v2 RootModel: use `.root` to access the underlying list
-        return ExtractedClaims.model_validate_json(raw).root
+        return ClaimList.model_validate_json(raw).claims
+    except ValidationError as e:
+        logger.error("extract_claims_from_query got output outside the schema: %s", e)
+        return []
     except Exception as e:
-        print(f"[ERROR] extract_claims_from_query failed: {e}")
+        logger.error("extract_claims_from_query failed: %s", e)
         return []
 
 
 def optimize_claim(claim: str) -> str:
-    client = get_client()
-    prompt = PROMPT_OPTIMIZE_CLAIM.format(claim=claim)
     try:
-        resp = client.responses.create(model=MODEL_CLAIM_OPTIMIZATION, input=prompt)
-        return getattr(resp, "output_text", None) or ""
+        return (
+            _output_text(
+                MODEL_CLAIM_OPTIMIZATION,
+                PROMPT_OPTIMIZE_CLAIM_PREFIX,
+                optimize_claim_input(claim),
+            )
+            or ""
+        )
     except Exception as e:
-        print(f"[ERROR] optimize_claim failed: {e}")
+        logger.error("optimize_claim failed: %s", e)
         return claim
 
 
 def get_query_for_wiki_article(claim: str) -> str:
-    client = get_client()
-    prompt = PROMPT_WIKI_ARTICLE_NAME.format(claim=claim)
     try:
-        resp = client.responses.create(model=MODEL_WIKI_TARGET, input=prompt)
-        return getattr(resp, "output_text", None) or ""
+        return (
+            _output_text(
+                MODEL_WIKI_TARGET,
+                PROMPT_WIKI_ARTICLE_NAME_PREFIX,
+                wiki_article_name_input(claim),
+            )
+            or ""
+        )
     except Exception as e:
-        print(f"[ERROR] get_query_for_wiki_article failed: {e}")
+        logger.error("get_query_for_wiki_article failed: %s", e)
         return ""
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Any, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
@@ -20,4 +21,18 @@ class Settings(BaseSettings):
     )
 
 
-SETTINGS = Settings()
+class LazySettings:
+    """
+    Proxy for Settings that parses the environment on first attribute access
+    instead of at import time. Set `_cache = None` to force a re-read.
+    """
+
+    _cache: Optional[Settings] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if LazySettings._cache is None:
+            LazySettings._cache = Settings(_env_file=str(ENV_PATH))
+        return getattr(LazySettings._cache, name)
+
+
+SETTINGS = LazySettings()
@@ -7,22 +7,28 @@ MODEL_CLAIM_OPTIMIZATION = "gpt-5-mini"
 MODEL_FACTCHECK = "gpt-5-nano"
 MODEL_WIKI_TARGET = "gpt-5-nano"
 
-PROMPT_EXTRACT_CLAIMS = (
+# Each prompt is a static PREFIX followed by a short per-call suffix (see prompts.py).
+# Keeping the long instruction block byte-identical across calls lets servers with
+# prefix caching (vLLM, llama.cpp, OpenAI) skip prefill for it after the first call.
+# Prefixes are plain text and never go through str.format.
+
+PROMPT_EXTRACT_CLAIMS_PREFIX = (
     "Strictly extract claims and facts that could be fact-checked from the following query. "
-    "Return the claims as a JSON array of strings. If no claims are present, such as strict questions, "
-    'return an empty array: "{query}"'
+    "Return the claims as a list of strings. If no claims are present, such as strict questions, "
+    "return an empty list: "
 )
 
-PROMPT_OPTIMIZE_CLAIM = (
+PROMPT_OPTIMIZE_CLAIM_PREFIX = (
     "Rewrite the following claim such that the core assertion of the claim can be easily "
-    "fact checked in a relevant article without requiring addtional context. "
-    "Return a single optimized claim. Claim: {claim}"
+    "fact checked in a relevant article without requiring additional context. "
+    "Return a single optimized claim. "
 )
 
-PROMPT_WIKI_ARTICLE_NAME = 'Return the name of the wikipedia article that contains the answer to the claim "{claim}"'
-
+PROMPT_WIKI_ARTICLE_NAME_PREFIX = (
+    "Return the name of the wikipedia article that contains the answer to the claim "
+)
 
-PROMPT_FACTCHECK = (
+PROMPT_FACTCHECK_PREFIX = (
     "Based on the following scraped content from a web page, please analyze the claim and provide:\n"
     '1. A label of either "True" or "False" based on whether the claim is supported by the content\n'
     "2. A single contiguous block of text from the article that verifies or disproves the claim\n\n"
@@ -30,10 +36,7 @@ PROMPT_FACTCHECK = (
     "Do not combine multiple separate sentences or paragraphs. Find the most relevant and concise single block of text that "
     "directly verifies or disproves the claim.\n\n"
     "Return your response in this exact JSON format:\n"
-    '{{"label": "True" or "False", "evidence": "single contiguous block of text from the article"}}\n\n'
-    'Claim: "{claim}"\n\n'
-    "Scraped Content:\n"
-    "{scraped}"
+    '{"label": "True" or "False", "evidence": "single contiguous block of text from the article"}\n\n'
 )
 
 WIKI_USER_AGENT = (
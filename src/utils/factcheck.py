@@ -1,29 +1,170 @@
+import asyncio
+import logging
+import time
 from typing import Optional
-from urllib.parse import quote
-from .openai_client import get_client
-from .constants import MODEL_FACTCHECK, PROMPT_FACTCHECK
+
+import orjson
+from openai import AsyncOpenAI, OpenAI
+
+from .openai_client import get_async_client, get_client
+from .constants import MODEL_FACTCHECK, PROMPT_FACTCHECK_PREFIX
+from .json_stream import JSONObjectWatcher
+from .llm_cache import cached
 from .models import ClaimResult
+from .prompts import factcheck_input, messages
+from .retrieve import bm25_topk
+
+logger = logging.getLogger(__name__)
 
 
 def find_answer_in_article(scraped_content: str, claim: str) -> Optional[ClaimResult]:
-    client = get_client()
-    prompt = PROMPT_FACTCHECK.format(claim=claim, scraped=scraped_content)
     try:
-        resp = client.responses.create(model=MODEL_FACTCHECK, input=prompt)
-        text = getattr(resp, "output_text", None)
-        if not text:
-            return None
-        try:
-            return ClaimResult.model_validate_json(text)
-        except Exception:
-            # fallback: wrap raw text in evidence, mark label False
-            return ClaimResult(label="False", evidence=text)
+        text = _output_text(
+            MODEL_FACTCHECK,
+            PROMPT_FACTCHECK_PREFIX,
+            factcheck_input(claim, bm25_topk(scraped_content, claim)),
+            client=get_client(),
+        )
+        return _to_claim_result(text)
+    except Exception as e:
+        logger.error("find_answer_in_article failed: %s", e)
+        return None
+
+
+async def afind_answer_in_article(
+    scraped_content: str, claim: str, client: Optional[AsyncOpenAI] = None
+) -> Optional[ClaimResult]:
+    """Async find_answer_in_article; pass one shared client when fanning out over claims."""
+    client = client or get_async_client()
+    try:
+        # Splitting and ranking a whole article is CPU work; keep it off the event loop
+        trimmed = await asyncio.to_thread(bm25_topk, scraped_content, claim)
+        text = await _aoutput_text(
+            MODEL_FACTCHECK,
+            PROMPT_FACTCHECK_PREFIX,
+            factcheck_input(claim, trimmed),
+            client=client,
+        )
+        return _to_claim_result(text)
     except Exception as e:
-        print(f"[ERROR] find_answer_in_article failed: {e}")
+        logger.error("find_answer_in_article failed: %s", e)
         return None
 
 
-def build_text_fragment_link(url: str, evidence: Optional[str]) -> str:
-    if not evidence:
-        return url
-    return f"{url}#:~:text={quote(evidence)}"
+@cached
+def _output_text(
+    model: str, instructions: str, user_input: str, client: OpenAI
+) -> Optional[str]:
+    """Sync _aoutput_text; shares its cache entries."""
+    watcher = JSONObjectWatcher("label")
+    with client.responses.create(
+        model=model, input=messages(instructions, user_input), stream=True
+    ) as stream:
+        for event in stream:
+            if event.type == "response.output_text.delta" and watcher.feed(event.delta):
+                break
+    return watcher.text or None
+
+
+@cached
+async def _aoutput_text(
+    model: str, instructions: str, user_input: str, client: AsyncOpenAI
+) -> Optional[str]:
+    # Static instructions as the system message so the provider caches them as a prefix.
+    # Streamed so the request ends as soon as the verdict object is complete.
+    watcher = JSONObjectWatcher("label")
+    stream = await client.responses.create(
+        model=model, input=messages(instructions, user_input), stream=True
+    )
+    async with stream:
+        async for event in stream:
+            if event.type == "response.output_text.delta" and watcher.feed(event.delta):
+                break
+    return watcher.text or None
+
+
+def _factcheck_messages(scraped_content: str, claim: str) -> list[dict]:
+    return messages(
+        PROMPT_FACTCHECK_PREFIX,
+        factcheck_input(claim, bm25_topk(scraped_content, claim)),
+    )
+
+
+def submit_factcheck_batch(pairs: list[tuple[str, str]]) -> str:
+    """
+    Offline/eval variant: upload every (scraped_content, claim) pair as one Batch API
+    job against /v1/responses and return the batch id. Results are ready within the
+    24h completion window; fetch them with collect_factcheck_batch.
+    """
+    client = get_client()
+    lines = [
+        orjson.dumps(
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": {
+                    "model": MODEL_FACTCHECK,
+                    "input": _factcheck_messages(scraped_content, claim),
+                },
+            }
+        )
+        for i, (scraped_content, claim) in enumerate(pairs)
+    ]
+    batch_file = client.files.create(
+        file=("factcheck_batch.jsonl", b"\n".join(lines)), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id, endpoint="/v1/responses", completion_window="24h"
+    )
+    return batch.id
+
+
+def collect_factcheck_batch(
+    batch_id: str, n_pairs: int, poll_interval: float = 30.0
+) -> list[Optional[ClaimResult]]:
+    """Wait for a submit_factcheck_batch job and map its results back into pair order."""
+    client = get_client()
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in ("completed", "failed", "expired", "cancelled"):
+            break
+        time.sleep(poll_interval)
+
+    results: list[Optional[ClaimResult]] = [None] * n_pairs
+    if not batch.output_file_id:
+        logger.error("Fact-check batch %s ended with status %s", batch_id, batch.status)
+        return results
+
+    for line in client.files.content(batch.output_file_id).content.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") == 200:
+            results[int(record["custom_id"])] = _to_claim_result(
+                _response_output_text(response.get("body") or {})
+            )
+    return results
+
+
+def _response_output_text(body: dict) -> Optional[str]:
+    """Raw-JSON equivalent of the SDK's Response.output_text."""
+    texts = [
+        part.get("text", "")
+        for item in body.get("output", [])
+        if item.get("type") == "message"
+        for part in item.get("content", [])
+        if part.get("type") == "output_text"
+    ]
+    return "".join(texts) or None
+
+
+def _to_claim_result(text: Optional[str]) -> Optional[ClaimResult]:
+    if not text:
+        return None
+    try:
+        return ClaimResult.model_validate_json(text)
+    except Exception:
+        # fallback: wrap raw text in evidence, mark label False
+        return ClaimResult(label="False", evidence=text)
@@ -1,23 +1,113 @@
+import asyncio
+import httpx
+import logging
+import orjson
 import requests
+from pathlib import Path
+from requests.adapters import HTTPAdapter
 from typing import List, Optional
+from urllib3.util.retry import Retry
 from .config import SETTINGS
+from .llm_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
 
 GOOGLE_CSE_ENDPOINT = "https://www.googleapis.com/customsearch/v1"
+# The API returns at most 10 results per request
+GOOGLE_CSE_MAX_NUM = 10
 
+# Result URLs by (query, n); search results are stable over a day
+SEARCH_CACHE_PATH = Path(__file__).resolve().parents[2] / ".search_cache.sqlite"
+SEARCH_CACHE_TTL = 24 * 60 * 60
+_search_cache = SQLiteCache(SEARCH_CACHE_PATH, ttl=SEARCH_CACHE_TTL, memory_size=1024)
 
-def get_first_n_results_urls(query: str, n: int = 1) -> Optional[List[str]]:
-    params = {
+# Shared session so repeat searches reuse pooled keep-alive connections; sized for
+# the concurrent claim fan-out, retrying transient upstream errors
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
+
+def get_session() -> requests.Session:
+    return _session
+
+
+def get_search_cache() -> SQLiteCache:
+    return _search_cache
+
+
+def _search_params(query: str, n: int) -> dict:
+    return {
         "key": SETTINGS.custom_search_api_key,
         "cx": SETTINGS.custom_search_engine_id,
         "q": query,
+        "num": max(1, min(n, GOOGLE_CSE_MAX_NUM)),
+        # Only the links are read; skips snippets and pagemaps in the response
+        "fields": "items(link)",
     }
+
+
+def _cache_key(query: str, n: int) -> str:
+    # Results depend on the engine (its site restrictions), not just the query
+    return orjson.dumps([SETTINGS.custom_search_engine_id, query, n]).decode()
+
+
+def _cached_urls(query: str, n: int) -> Optional[List[str]]:
+    hit = get_search_cache().get(_cache_key(query, n))
+    return orjson.loads(hit) if hit is not None else None
+
+
+def _cache_urls(query: str, n: int, urls: Optional[List[str]]) -> Optional[List[str]]:
+    if urls:
+        get_search_cache().set(_cache_key(query, n), orjson.dumps(urls).decode())
+    return urls
+
+
+def _first_n_urls(data: dict, n: int) -> Optional[List[str]]:
+    items = data.get("items", [])
+    urls = [item.get("link") for item in items if item.get("link")]
+    return urls[:n] if urls else None
+
+
+def get_first_n_results_urls(query: str, n: int = 1) -> Optional[List[str]]:
+    """First n result URLs for query; successful results are cached for SEARCH_CACHE_TTL."""
+    hit = _cached_urls(query, n)
+    if hit is not None:
+        return hit
+    try:
+        resp = get_session().get(
+            GOOGLE_CSE_ENDPOINT, params=_search_params(query, n), timeout=30
+        )
+        resp.raise_for_status()
+        return _cache_urls(query, n, _first_n_urls(orjson.loads(resp.content), n))
+    except Exception as e:
+        logger.error("Google Custom Search failed: %s", e)
+        return None
+
+
+async def aget_first_n_results_urls(
+    client: httpx.AsyncClient, query: str, n: int = 1
+) -> Optional[List[str]]:
+    """Async get_first_n_results_urls on a caller-provided (shared) AsyncClient."""
+    # The search cache is SQLite, so it is read and written off the event loop
+    hit = await asyncio.to_thread(_cached_urls, query, n)
+    if hit is not None:
+        return hit
     try:
-        resp = requests.get(GOOGLE_CSE_ENDPOINT, params=params, timeout=30)
+        resp = await client.get(
+            GOOGLE_CSE_ENDPOINT, params=_search_params(query, n), timeout=30
+        )
         resp.raise_for_status()
-        data = resp.json()
-        items = data.get("items", [])
-        urls = [item.get("link") for item in items if item.get("link")]
-        return urls[:n] if urls else None
+        urls = _first_n_urls(orjson.loads(resp.content), n)
+        return await asyncio.to_thread(_cache_urls, query, n, urls)
     except Exception as e:
-        print(f"[ERROR] Google Custom Search failed: {e}")
+        logger.error("Google Custom Search failed: %s", e)
         return None
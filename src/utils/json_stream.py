@@ -0,0 +1,58 @@
+"""
+Early stopping for streamed model output that should contain one JSON object.
+
+Models often keep generating after the object they were asked for (explanations,
+a repeated answer). Feeding streamed deltas to a JSONObjectWatcher tells the
+caller when it already has everything it needs, so it can close the stream.
+"""
+
+import json
+from typing import Optional
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class JSONObjectWatcher:
+    """
+    Tracks brace depth over streamed text and reports when a complete top-level
+    JSON object containing `required_key` has been received. Braces inside JSON
+    strings are ignored; text outside objects is kept but not inspected.
+    """
+
+    def __init__(self, required_key: str):
+        self.required_key = required_key
+        self.text = ""
+        self._depth = 0
+        self._start: Optional[int] = None
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        offset = len(self.text)
+        self.text += chunk
+        for i, char in enumerate(chunk, offset):
+            if self._depth and self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == "{":
+                if not self._depth:
+                    self._start = i
+                self._depth += 1
+            elif char == '"' and self._depth:
+                self._in_string = True
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                if not self._depth and self._has_required_key(self._start, i + 1):
+                    return True
+        return False
+
+    def _has_required_key(self, start: int, end: int) -> bool:
+        try:
+            obj, _end = _JSON_DECODER.raw_decode(self.text[start:end])
+        except json.JSONDecodeError:
+            return False
+        return isinstance(obj, dict) and self.required_key in obj
@@ -0,0 +1,53 @@
+"""
+Text fragment links (https://wicg.github.io/scroll-to-text-fragment/) that
+scroll the source article to the quoted evidence.
+"""
+
+import functools
+from typing import Optional
+from urllib.parse import quote
+
+# Evidence longer than this is linked as a start,end range instead of verbatim
+MAX_FRAGMENT_CHARS = 120
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote(text: str) -> str:
+    # ',', '-' and '&' are fragment directive syntax. quote() escapes ',' and '&'
+    # but always leaves '-' alone, so that one is escaped by hand.
+    return quote(text, safe="").replace("-", "%2D")
+
+
+# Browsers only match fragments on word boundaries, so cuts never split a word
+def _head_words(text: str, limit: int) -> str:
+    head = text[:limit]
+    if not text[limit].isspace() and " " in head:
+        head = head.rsplit(" ", 1)[0]
+    return head.strip()
+
+
+def _tail_words(text: str, limit: int) -> str:
+    tail = text[-limit:]
+    if not text[-limit - 1].isspace() and " " in tail:
+        tail = tail.split(" ", 1)[1]
+    return tail.strip()
+
+
+def build_text_fragment_link(url: str, evidence: Optional[str]) -> str:
+    """
+    Link to `evidence` in the page at `url`. Long evidence becomes a
+    `text=start,end` range over its first and last words, so the URL stays short
+    and the browser still highlights the whole passage.
+    """
+    if not evidence or not evidence.strip():
+        return url
+    evidence = " ".join(evidence.split())
+    if len(evidence) <= MAX_FRAGMENT_CHARS:
+        return f"{url}#:~:text={_quote(evidence)}"
+
+    half = (
+        MAX_FRAGMENT_CHARS // 2
+    )  # evidence is longer than 2 * half, so both cuts are in range
+    start = _head_words(evidence, half)
+    end = _tail_words(evidence, half)
+    return f"{url}#:~:text={_quote(start)},{_quote(end)}"
@@ -0,0 +1,144 @@
+"""
+Content-addressed on-disk cache for LLM responses.
+
+Responses are keyed by sha256(model + prompt parts), so changing the model or any
+part of the prompt (e.g. system instructions or user input) naturally misses the cache.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+LLM_CACHE_PATH = Path(__file__).resolve().parents[2] / ".llm_cache.sqlite"
+LLM_CACHE_MEMORY_SIZE = 10_000
+# Responses older than this are no longer served and are pruned when the cache opens
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+
+
+class SQLiteCache:
+    """
+    Thin thread-safe key/value store over a single SQLite table, optionally
+    fronted by an in-process LRU of the `memory_size` most recently used entries.
+    """
+
+    def __init__(self, path: Path, ttl: Optional[float] = None, memory_size: int = 0):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self._memory: OrderedDict = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, ts INTEGER)"
+            )
+            if self.ttl is not None:
+                # Expired rows are never served again, so keep the file from growing forever
+                self._conn.execute(
+                    "DELETE FROM cache WHERE ts < ?", (time.time() - self.ttl,)
+                )
+                self._conn.commit()
+        return self._conn
+
+    def _remember(self, key: str, value: str, ts: int) -> None:
+        if not self.memory_size:
+            return
+        self._memory[key] = (value, ts)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._memory.get(key)
+            if row is not None:
+                self._memory.move_to_end(key)
+            else:
+                row = (
+                    self._connect()
+                    .execute("SELECT value, ts FROM cache WHERE key = ?", (key,))
+                    .fetchone()
+                )
+                if row is None:
+                    return None
+                self._remember(key, *row)
+        value, ts = row
+        if self.ttl is not None and time.time() - ts > self.ttl:
+            return None
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        ts = int(time.time())
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, value, ts),
+            )
+            conn.commit()
+            self._remember(key, value, ts)
+
+
+_cache = SQLiteCache(
+    LLM_CACHE_PATH, ttl=LLM_CACHE_TTL, memory_size=LLM_CACHE_MEMORY_SIZE
+)
+
+
+def get_cache() -> SQLiteCache:
+    return _cache
+
+
+def make_key(model: str, *prompt_parts: str) -> str:
+    # A single part hashes exactly as before parts were supported
+    return hashlib.sha256(
+        (model + "\x1f".join(prompt_parts)).encode("utf-8")
+    ).hexdigest()
+
+
+def cached(fn: Callable[..., Optional[str]]) -> Callable[..., Optional[str]]:
+    """
+    Memoize fn(model, *prompt_parts, **kwargs) -> text on disk; works on sync and
+    async functions. Keyword arguments (e.g. a client) are passed through but are
+    not part of the key. Empty or failed responses are never stored, so errors are
+    retried next time. Async callers do their SQLite reads and writes on a worker
+    thread so the event loop is never blocked on disk.
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(
+            model: str, *prompt_parts: str, **kwargs
+        ) -> Optional[str]:
+            key = make_key(model, *prompt_parts)
+            hit = await asyncio.to_thread(get_cache().get, key)
+            if hit is not None:
+                return hit
+            text = await fn(model, *prompt_parts, **kwargs)
+            if text:
+                await asyncio.to_thread(get_cache().set, key, text)
+            return text
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(model: str, *prompt_parts: str, **kwargs) -> Optional[str]:
+        key = make_key(model, *prompt_parts)
+        hit = get_cache().get(key)
+        if hit is not None:
+            return hit
+        text = fn(model, *prompt_parts, **kwargs)
+        if text:
+            get_cache().set(key, text)
+        return text
+
+    return wrapper
@@ -17,7 +17,19 @@ def optimize_claim(claim: str) -> str:
     return client.optimize_claim(claim)
 
 
+def optimize_claims(claims: list[str]) -> list[str]:
+    """Batched optimize_claim: one local model batch for all claims."""
+    client = get_local_openai_client()
+    return client.optimize_claims(claims)
+
+
 def get_query_for_wiki_article(claim: str) -> str:
     """Get Wikipedia article query using local model."""
     client = get_local_openai_client()
     return client.get_wiki_article_name(claim)
+
+
+def get_queries_for_wiki_articles(claims: list[str]) -> list[str]:
+    """Batched get_query_for_wiki_article: one local model batch for all claims."""
+    client = get_local_openai_client()
+    return client.get_wiki_article_names(claims)
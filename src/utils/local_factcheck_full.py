@@ -2,17 +2,59 @@
 Local model version of fact-checking that replaces OpenAI calls.
 """
 
+import logging
 from typing import Optional
-from urllib.parse import quote
 from .local_openai_client import get_local_openai_client
 from .models import ClaimResult
+from .retrieve import bm25_topk, bm25_topk_many
+
+logger = logging.getLogger(__name__)
+
+
+def _claim_result_response_format() -> dict:
+    """ClaimResult as an OpenAI-style json_schema response_format, label pinned to True/False."""
+    schema = ClaimResult.model_json_schema()
+    schema["properties"]["label"]["enum"] = ["True", "False"]
+    schema["additionalProperties"] = False
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": "ClaimResult", "strict": True, "schema": schema},
+    }
+
+
+# Constrained decoding makes the output always parse and stop at the closing brace
+CLAIM_RESULT_RESPONSE_FORMAT = _claim_result_response_format()
+
+# Candidate sentences BM25 keeps per article; the client then re-ranks them with
+# claim key terms and packs the best into its token budget (MAX_CONTENT_TOKENS)
+CANDIDATE_SENTENCES = 128
 
 
 def find_answer_in_article(scraped_content: str, claim: str) -> Optional[ClaimResult]:
     """Find answer in article using local model instead of OpenAI."""
     client = get_local_openai_client()
-    result = client.factcheck_claim(claim, scraped_content)
-    
+    # Only the most relevant sentences go to the model to keep prefill short
+    return _to_claim_result(
+        client.factcheck_claim(
+            claim,
+            bm25_topk(scraped_content, claim, k=CANDIDATE_SENTENCES),
+            response_format=CLAIM_RESULT_RESPONSE_FORMAT,
+        )
+    )
+
+
+def find_answers_in_articles(pairs: list[tuple[str, str]]) -> list[Optional[ClaimResult]]:
+    """Fact-check (scraped_content, claim) pairs in one batched local model call."""
+    client = get_local_openai_client()
+    trimmed = bm25_topk_many(pairs, k=CANDIDATE_SENTENCES)
+    results = client.factcheck_claims(
+        [(claim, content) for content, (_scraped_content, claim) in zip(trimmed, pairs)],
+        response_format=CLAIM_RESULT_RESPONSE_FORMAT,
+    )
+    return [_to_claim_result(result) for result in results]
+
+
+def _to_claim_result(result: Optional[dict]) -> Optional[ClaimResult]:
     if result:
         try:
             return ClaimResult(
@@ -20,14 +62,7 @@ def find_answer_in_article(scraped_content: str, claim: str) -> Optional[ClaimRe
                 evidence=result["evidence"]
             )
         except Exception as e:
-            print(f"[ERROR] Failed to create ClaimResult: {e}")
+            logger.error("Failed to create ClaimResult: %s", e)
             return ClaimResult(label="False", evidence=result.get("evidence", ""))
     
     return None
-
-
-def build_text_fragment_link(url: str, evidence: Optional[str]) -> str:
-    """Build a text fragment link for the evidence."""
-    if not evidence:
-        return url
-    return f"{url}#:~:text={quote(evidence)}"
@@ -3,10 +3,131 @@ Local OpenAI-compatible client that replaces OpenAI API calls with local model c
 This allows the original system to work with local models instead of OpenAI.
 """
 
+import asyncio
+import functools
 import json
-import requests
+import logging
+import re
+import httpx
+import orjson
 from typing import Optional, Dict, Any
 
+from . import llm_cache
+from .json_stream import JSONObjectWatcher
+from .models import ClaimList
+from .retrieve import BM25Index, bm25_scores, tokenize
+from .semantic_cache import SemanticCache
+from .prompts import (
+    extract_claims_prompt,
+    factcheck_prompt,
+    optimize_claim_prompt,
+    wiki_article_name_prompt,
+)
+
+logger = logging.getLogger(__name__)
+
+# Connection pool per client; HTTP/2 multiplexes concurrent requests over one connection
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+# Concurrent requests in flight when prompts have to go one per request
+MAX_CONCURRENT_REQUESTS = 10
+
+# Responses sampled hotter than this vary run to run, so they are never cached
+CACHE_MAX_TEMPERATURE = 0.2
+
+# Token budget for the article excerpt in a fact-check prompt (~8k characters of prose)
+MAX_CONTENT_TOKENS = 2000
+
+# Added to a paragraph's BM25 score per claim key term (year, proper noun) it contains
+KEY_TERM_BONUS = 1.0
+
+# Compiled once at import instead of on every parse
+_EVIDENCE_RE = re.compile(r'"evidence":\s*"([^"]*)"')
+# Word pieces of up to 6 characters and punctuation marks, see estimate_tokens
+_TOKEN_ESTIMATE_RE = re.compile(r'\w{1,6}|[^\w\s]')
+# Years like 1943 and capitalized words of 4+ characters (names, places)
+_KEY_TERM_RE = re.compile(r'\b(?:\d{4}|[A-Z][A-Za-z0-9\-]{3,})\b')
+
+# orjson has no prefix decoding; used only when the output has text around the JSON
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _find_json(text: str, opener: str) -> Any:
+    """
+    First complete JSON value in `text` that starts with `opener` ('{' or '['),
+    or None. Unlike a regex this handles nested and escaped brackets, and each
+    attempt stops where the value ends.
+    """
+    # Constrained or well-behaved output is nothing but the JSON value
+    stripped = text.strip()
+    if stripped.startswith(opener):
+        try:
+            return orjson.loads(stripped)
+        except orjson.JSONDecodeError:
+            pass
+    
+    i = text.find(opener)
+    while i != -1:
+        try:
+            obj, _end = _JSON_DECODER.raw_decode(text, i)
+            return obj
+        except json.JSONDecodeError:
+            i = text.find(opener, i + 1)
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _split_and_index(
+    content: str,
+) -> tuple[tuple[str, ...], tuple[str, ...], BM25Index, tuple[int, ...]]:
+    """
+    Paragraphs of `content` with their lowercased forms, their BM25 index and their
+    estimated model token counts. Memoized
+    because one scraped article is usually fact-checked against several claims.
+    """
+    paragraphs = tuple(content.split('\n\n'))
+    return (
+        paragraphs,
+        tuple(paragraph.lower() for paragraph in paragraphs),
+        BM25Index([tokenize(paragraph) for paragraph in paragraphs]),
+        tuple(estimate_tokens(paragraph) for paragraph in paragraphs),
+    )
+
+
+def _key_terms(claim: str) -> list[str]:
+    """Key terms of the claim (years, capitalized names), lowercased and deduplicated in order."""
+    return list(dict.fromkeys(m.group().lower() for m in _KEY_TERM_RE.finditer(claim)))
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate model token count: one per punctuation mark and per 6 characters
+    of a word. Close to BPE on English prose, and it does not undercount URLs,
+    numbers or code, which split into many short tokens.
+    """
+    return len(_TOKEN_ESTIMATE_RE.findall(text))
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Leading part of `text` that estimate_tokens counts as at most max_tokens."""
+    if max_tokens <= 0:
+        return ""
+    for n, match in enumerate(_TOKEN_ESTIMATE_RE.finditer(text), 1):
+        if n == max_tokens:
+            return text[:match.end()]
+    return text
+
+
+# ClaimList as an OpenAI-style json_schema response_format for claim extraction
+CLAIM_LIST_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ClaimList",
+        "strict": True,
+        "schema": {**ClaimList.model_json_schema(), "additionalProperties": False},
+    },
+}
+
 
 class LocalOpenAIClient:
     """Local OpenAI-compatible client that uses local models."""
@@ -14,161 +135,429 @@ class LocalOpenAIClient:
     def __init__(self, base_url: str = "http://localhost:1234", model: str = "local-model"):
         self.base_url = base_url.rstrip('/')
         self.model = model
+        # Persistent keep-alive pool for every sync request to this server; skips the
+        # OpenAI SDK and requests layers entirely. retries covers connection failures
+        # (e.g. the server still loading its model).
+        self._http = httpx.Client(
+            base_url=self.base_url,
+            transport=httpx.HTTPTransport(http2=True, retries=3, limits=_HTTP_LIMITS),
+            timeout=httpx.Timeout(60),
+        )
+        # Cleared once the server shows it rejects response_format (see _drop_response_format)
+        self.supports_response_format = True
+        # Reuses claim extraction/optimization results for inputs that differ only in formatting
+        self._semantic_cache = SemanticCache()
     
-    def _make_request(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.1) -> Optional[str]:
-        """Make a request to the local model."""
-        try:
-            url = f"{self.base_url}/v1/chat/completions"
-            payload = {
-                "model": self.model,
-                "messages": [{"role": "user", "content": prompt}],
+    def _chat_payload(self, prompt: str, max_tokens: int, temperature: float,
+                      response_format: Optional[dict]) -> dict:
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            # Reuse the KV cache of the shared prompt prefix (llama.cpp server);
+            # vLLM and LM Studio cache prefixes automatically and ignore this field
+            "cache_prompt": True
+        }
+        if response_format is not None and self.supports_response_format:
+            payload["response_format"] = response_format
+        return payload
+    
+    def _drop_response_format(self, error: str, retry_succeeded: bool) -> None:
+        """
+        After a 400/422 on a request with response_format, turn constrained decoding
+        off only if it was the cause: the error names it, or the same request then
+        succeeded without it. Other client errors (context length, malformed prompt)
+        leave it on.
+        """
+        lowered = error.lower()
+        if retry_succeeded or "response_format" in lowered or "json_schema" in lowered:
+            logger.warning("Local server rejected response_format, continuing unconstrained: %s", error[:200])
+            self.supports_response_format = False
+    
+    def _cache_key(self, endpoint: str, prompt: str, max_tokens: int, temperature: float,
+                   response_format: Optional[dict], stop_at_key: Optional[str] = None) -> str:
+        """
+        Every request option that changes the returned text is part of the key, so
+        constrained, unconstrained, batched and streamed outputs never stand in for
+        each other. Computed with the response_format the server actually gets.
+        """
+        options = orjson.dumps(
+            {
+                "endpoint": endpoint,
+                "max_tokens": max_tokens,
                 "temperature": temperature,
-                "max_tokens": max_tokens
-            }
+                "response_format": response_format if self.supports_response_format else None,
+                "stop_at_key": stop_at_key,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        ).decode()
+        # Different servers can expose different weights under the same model name
+        return llm_cache.make_key(f"{self.base_url}|{self.model}", options, prompt)
+    
+    def _make_request(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.1,
+                      response_format: Optional[dict] = None,
+                      stop_at_key: Optional[str] = None) -> Optional[str]:
+        """
+        Make a request to the local model; low-temperature responses are cached (llm_cache).
+        With stop_at_key the completion is streamed and cut off as soon as a JSON
+        object containing that key has closed.
+        """
+        if stop_at_key is not None:
+            request = functools.partial(self._stream_chat, stop_at_key=stop_at_key)
+        else:
+            request = self._request_chat
+        if temperature > CACHE_MAX_TEMPERATURE:
+            return request(prompt, max_tokens, temperature, response_format)
+        
+        key_args = ("chat", prompt, max_tokens, temperature, response_format, stop_at_key)
+        hit = llm_cache.get_cache().get(self._cache_key(*key_args))
+        if hit is not None:
+            return hit
+        text = request(prompt, max_tokens, temperature, response_format)
+        if text:
+            # Re-keyed in case the server just rejected response_format
+            llm_cache.get_cache().set(self._cache_key(*key_args), text)
+        return text
+    
+    def _request_chat(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.1,
+                      response_format: Optional[dict] = None) -> Optional[str]:
+        try:
+            payload = self._chat_payload(prompt, max_tokens, temperature, response_format)
+            
+            response = self._http.post("/v1/chat/completions", content=orjson.dumps(payload),
+                                  headers={"Content-Type": "application/json"})
+            if "response_format" in payload and response.status_code in (400, 422):
+                text = self._request_chat(prompt, max_tokens, temperature)
+                self._drop_response_format(response.text, retry_succeeded=text is not None)
+                return text
+            response.raise_for_status()
+            
+            choices = orjson.loads(response.content).get("choices")
+            if choices:
+                return choices[0]["message"]["content"]
+        except Exception as e:
+            logger.error("Local model request failed: %s", e)
+        
+        return None
+    
+    def _stream_chat(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.1,
+                     response_format: Optional[dict] = None, *, stop_at_key: str) -> Optional[str]:
+        """_request_chat over a streamed completion that stops once the JSON answer is complete."""
+        try:
+            payload = self._chat_payload(prompt, max_tokens, temperature, response_format)
+            payload["stream"] = True
+            
+            with self._http.stream("POST", "/v1/chat/completions", content=orjson.dumps(payload),
+                              headers={"Content-Type": "application/json"}) as response:
+                if "response_format" in payload and response.status_code in (400, 422):
+                    response.read()
+                    text = self._stream_chat(prompt, max_tokens, temperature, stop_at_key=stop_at_key)
+                    self._drop_response_format(response.text, retry_succeeded=text is not None)
+                    return text
+                response.raise_for_status()
+                
+                # Server-sent events: "data: {chunk}" lines, ending with "data: [DONE]"
+                watcher = JSONObjectWatcher(stop_at_key)
+                for line in response.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = orjson.loads(data).get("choices")
+                    delta = choices[0].get("delta", {}).get("content") if choices else None
+                    # Leaving the block closes the connection, which stops generation
+                    if delta and watcher.feed(delta):
+                        break
+            return watcher.text or None
+        except Exception as e:
+            logger.error("Local model request failed: %s", e)
+        
+        return None
+    
+    async def _amake_request(self, client: httpx.AsyncClient, prompt: str, max_tokens: int = 1000,
+                             temperature: float = 0.1,
+                             response_format: Optional[dict] = None) -> Optional[str]:
+        """Async _make_request on a caller-provided AsyncClient (base_url set), so a batch shares one pool."""
+        try:
+            payload = self._chat_payload(prompt, max_tokens, temperature, response_format)
             
-            response = requests.post(url, json=payload, timeout=60)
+            response = await client.post("/v1/chat/completions", content=orjson.dumps(payload),
+                                         headers={"Content-Type": "application/json"})
+            if "response_format" in payload and response.status_code in (400, 422):
+                text = await self._amake_request(client, prompt, max_tokens, temperature)
+                self._drop_response_format(response.text, retry_succeeded=text is not None)
+                return text
             response.raise_for_status()
             
-            data = response.json()
-            if "choices" in data and len(data["choices"]) > 0:
-                return data["choices"][0]["message"]["content"]
+            choices = orjson.loads(response.content).get("choices")
+            if choices:
+                return choices[0]["message"]["content"]
         except Exception as e:
-            print(f"[ERROR] Local model request failed: {e}")
+            logger.error("Local model request failed: %s", e)
         
         return None
     
+    async def _amake_requests(self, prompts: list[str], max_tokens: int = 1000, temperature: float = 0.1,
+                              response_format: Optional[dict] = None) -> list[Optional[str]]:
+        """One chat request per prompt, run concurrently (at most MAX_CONCURRENT_REQUESTS at once)."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def one(client: httpx.AsyncClient, prompt: str) -> Optional[str]:
+            async with semaphore:
+                return await self._amake_request(client, prompt, max_tokens, temperature, response_format)
+        
+        async with httpx.AsyncClient(base_url=self.base_url, http2=True, limits=_HTTP_LIMITS,
+                                     timeout=httpx.Timeout(60)) as client:
+            return await asyncio.gather(*[one(client, prompt) for prompt in prompts])
+    
+    def batch_responses(self, prompts: list[str], max_tokens: int = 1000, temperature: float = 0.1,
+                        max_batch_size: int = 32,
+                        response_format: Optional[dict] = None) -> list[Optional[str]]:
+        """
+        Run many prompts through the local model as true batches.
+        
+        Prompts are sent as a single list to /v1/completions so servers with batching
+        (vLLM, llama.cpp, LM Studio) run them in one forward pass. max_batch_size keeps
+        each request within the server's batched-token budget. If the server rejects
+        list prompts, falls back to concurrent chat requests, one per prompt.
+        
+        response_format (OpenAI json_schema form) constrains decoding on servers that
+        support it (vLLM, llama.cpp); servers that reject it are retried unconstrained.
+        
+        As in _make_request, low-temperature responses are cached and only the
+        prompts that miss the cache are sent.
+        """
+        cacheable = temperature <= CACHE_MAX_TEMPERATURE
+        if cacheable:
+            results: list[Optional[str]] = [
+                llm_cache.get_cache().get(
+                    self._cache_key("completions", prompt, max_tokens, temperature, response_format)
+                )
+                for prompt in prompts
+            ]
+        else:
+            results = [None] * len(prompts)
+        misses = [i for i, text in enumerate(results) if text is None]
+        
+        for start in range(0, len(misses), max_batch_size):
+            indices = misses[start:start + max_batch_size]
+            chunk = [prompts[i] for i in indices]
+            try:
+                texts = self._post_chunk(chunk, max_tokens, temperature, response_format)
+            except Exception as e:
+                logger.warning("Local batch request failed, falling back to per-prompt requests: %s", e)
+                texts = asyncio.run(self._amake_requests(chunk, max_tokens, temperature, response_format))
+            for i, text in zip(indices, texts):
+                results[i] = text
+                if cacheable and text:
+                    # Stored under the key looked up above, whichever path produced it,
+                    # so a server without list prompts still gets cache hits next run
+                    key = self._cache_key("completions", prompts[i], max_tokens, temperature, response_format)
+                    llm_cache.get_cache().set(key, text)
+        
+        return results
+    
+    def _post_chunk(self, prompts: list[str], max_tokens: int, temperature: float,
+                    response_format: Optional[dict]) -> list[Optional[str]]:
+        if response_format is not None and self.supports_response_format:
+            try:
+                return self.post_completion(prompts, max_tokens, temperature, response_format)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in (400, 422):
+                    raise
+                try:
+                    texts = self.post_completion(prompts, max_tokens, temperature)
+                except Exception:
+                    self._drop_response_format(e.response.text, retry_succeeded=False)
+                    raise
+                self._drop_response_format(e.response.text, retry_succeeded=True)
+                return texts
+        return self.post_completion(prompts, max_tokens, temperature)
+    
+    def post_completion(self, prompts: list[str], max_tokens: int = 1000, temperature: float = 0.1,
+                        response_format: Optional[dict] = None) -> list[Optional[str]]:
+        """POST a list of prompts to /v1/completions; returns one text per prompt, in order."""
+        payload = {
+            "model": self.model,
+            "prompt": prompts,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            # Reuse the KV cache of the shared prompt prefix (llama.cpp server);
+            # vLLM and LM Studio cache prefixes automatically and ignore this field
+            "cache_prompt": True
+        }
+        if response_format is not None:
+            payload["response_format"] = response_format
+        
+        response = self._http.post(
+            "/v1/completions",
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=60 * len(prompts),
+        )
+        response.raise_for_status()
+        
+        choices = orjson.loads(response.content).get("choices", [])
+        if len(choices) != len(prompts):
+            raise ValueError(f"expected {len(prompts)} choices, got {len(choices)}")
+        
+        texts: list[Optional[str]] = [None] * len(prompts)
+        for i, choice in enumerate(choices):
+            texts[choice.get("index", i)] = choice.get("text") or None
+        return texts
+    
     def extract_claims(self, query: str) -> list[str]:
         """Extract claims from a query using local model."""
-        prompt = f"""Strictly extract claims and facts that could be fact-checked from the following query. 
-Return the claims as a JSON array of strings. If no claims are present, such as strict questions, 
-return an empty array: "{query}"
-
-Respond with only the JSON array, no other text."""
+        hit = self._semantic_cache.get("extract_claims", query)
+        if hit is not None:
+            return list(hit)
         
-        response = self._make_request(prompt, max_tokens=500)
+        claims = self._extract_claims(query)
+        if claims:
+            self._semantic_cache.set("extract_claims", query, tuple(claims))
+        return claims
+    
+    def _extract_claims(self, query: str) -> list[str]:
+        if self.supports_response_format:
+            # Constrained decoding: the output is exactly a ClaimList object
+            response = self._make_request(
+                extract_claims_prompt(query), max_tokens=500, response_format=CLAIM_LIST_RESPONSE_FORMAT
+            )
+        else:
+            response = self._make_request(
+                extract_claims_prompt(query) + "\n\nRespond with only the JSON array, no other text.",
+                max_tokens=500,
+            )
         if not response:
             return []
         
-        try:
-            # Try to parse JSON from response
-            import re
-            json_match = re.search(r'\[.*?\]', response)
-            if json_match:
-                claims = json.loads(json_match.group())
-                return claims if isinstance(claims, list) else []
-        except Exception:
-            pass
-        
-        return []
+        # Servers without response_format support answer with a bare array
+        claims = _find_json(response, '{')
+        claims = claims.get("claims") if isinstance(claims, dict) else _find_json(response, '[')
+        if not isinstance(claims, list):
+            return []
+        # Unconstrained output may hold nulls, numbers or blanks; callers dedupe strings
+        return [c.strip() for c in claims if isinstance(c, str) and c.strip()]
+    
+    def _optimize_claim_prompt(self, claim: str) -> str:
+        return (
+            optimize_claim_prompt(claim)
+            + "\n\nRespond with only the optimized claim, no other text."
+        )
     
     def optimize_claim(self, claim: str) -> str:
         """Optimize a claim using local model."""
-        prompt = f"""Rewrite the following claim such that the core assertion of the claim can be easily 
-fact checked in a relevant article without requiring additional context. 
-Return a single optimized claim. Claim: {claim}
-
-Respond with only the optimized claim, no other text."""
+        hit = self._semantic_cache.get("optimize_claim", claim)
+        if hit is not None:
+            return hit
         
-        response = self._make_request(prompt, max_tokens=200)
-        return response if response else claim
+        response = self._make_request(self._optimize_claim_prompt(claim), max_tokens=200)
+        if not response:
+            return claim
+        self._semantic_cache.set("optimize_claim", claim, response)
+        return response
+    
+    def optimize_claims(self, claims: list[str]) -> list[str]:
+        """Batched optimize_claim: one local model batch for the claims the semantic cache misses."""
+        optimized = [self._semantic_cache.get("optimize_claim", claim) for claim in claims]
+        misses = [i for i, hit in enumerate(optimized) if hit is None]
+        responses = self.batch_responses(
+            [self._optimize_claim_prompt(claims[i]) for i in misses], max_tokens=200
+        )
+        for i, response in zip(misses, responses):
+            if response:
+                self._semantic_cache.set("optimize_claim", claims[i], response)
+            optimized[i] = response or claims[i]
+        return optimized
+    
+    def _wiki_article_name_prompt(self, claim: str) -> str:
+        return (
+            wiki_article_name_prompt(claim)
+            + "\n\nRespond with only the article name, no other text."
+        )
     
     def get_wiki_article_name(self, claim: str) -> str:
         """Get Wikipedia article name for a claim using local model."""
-        prompt = f'Return the name of the wikipedia article that contains the answer to the claim "{claim}"\n\nRespond with only the article name, no other text.'
-        
-        response = self._make_request(prompt, max_tokens=100)
+        response = self._make_request(self._wiki_article_name_prompt(claim), max_tokens=100)
         return response if response else claim
     
-    def _select_relevant_content(self, claim: str, content: str, max_length: int = 8000) -> str:
-        """Select the most relevant content for fact-checking."""
-        if len(content) <= max_length:
+    def get_wiki_article_names(self, claims: list[str]) -> list[str]:
+        """Batched get_wiki_article_name: one local model batch for all claims."""
+        prompts = [self._wiki_article_name_prompt(claim) for claim in claims]
+        responses = self.batch_responses(prompts, max_tokens=100)
+        return [response if response else claim for claim, response in zip(claims, responses)]
+    
+    def _select_relevant_content(self, claim: str, content: str,
+                                 max_tokens: int = MAX_CONTENT_TOKENS) -> str:
+        """Select the most relevant content for fact-checking, within max_tokens (estimated)."""
+        # Split content into paragraphs, with token counts estimated once per article
+        paragraphs, paragraphs_lower, paragraph_index, token_counts = _split_and_index(content)
+        if sum(token_counts) <= max_tokens:
             return content
         
-        # Extract key terms from the claim
-        claim_lower = claim.lower()
-        key_terms = []
+        key_terms = _key_terms(claim)
         
-        # Look for important terms (dates, names, etc.)
-        import re
-        dates = re.findall(r'\b\d{4}\b', claim)  # Years like 1943, 1912
-        key_terms.extend(dates)
+        # Rank paragraphs against the whole claim with BM25
+        scores = bm25_scores(tokenize(claim), paragraph_index)
         
-        # Extract potential key words (capitalized words, important nouns)
-        words = claim.split()
-        for word in words:
-            if len(word) > 3 and word[0].isupper():  # Capitalized words
-                key_terms.append(word.lower())
-        
-        # Find sections that contain key terms
-        content_lower = content.lower()
-        relevant_sections = []
-        
-        # Split content into paragraphs
-        paragraphs = content.split('\n\n')
-        
-        for paragraph in paragraphs:
-            paragraph_lower = paragraph.lower()
-            relevance_score = 0
-            
-            # Score based on key terms found
-            for term in key_terms:
-                if term in paragraph_lower:
-                    relevance_score += 1
-            
-            if relevance_score > 0:
-                relevant_sections.append((relevance_score, paragraph))
+        # Key terms still count extra: BM25 weighs a year like any other token.
+        # One alternation scans each paragraph once for all terms (longest first,
+        # so a term is not shadowed by its own prefix).
+        if key_terms:
+            terms_re = re.compile("|".join(map(re.escape, sorted(key_terms, key=len, reverse=True))))
+            for i, paragraph_lower in enumerate(paragraphs_lower):
+                scores[i] += KEY_TERM_BONUS * len(set(terms_re.findall(paragraph_lower)))
         
         # Sort by relevance and take the most relevant sections
-        relevant_sections.sort(key=lambda x: x[0], reverse=True)
+        relevant_sections = [i for i, score in enumerate(scores) if score > 0]
+        relevant_sections.sort(key=scores.__getitem__, reverse=True)
         
+        # Greedily pack the best paragraphs that still fit the token budget
         selected_content = ""
-        for score, paragraph in relevant_sections:
-            if len(selected_content) + len(paragraph) <= max_length:
-                selected_content += paragraph + "\n\n"
-            else:
-                break
+        used_tokens = 0
+        for i in relevant_sections:
+            if used_tokens + token_counts[i] <= max_tokens:
+                selected_content += paragraphs[i] + "\n\n"
+                used_tokens += token_counts[i]
         
         # If we still have space, add the beginning of the article
-        if len(selected_content) < max_length:
-            remaining_space = max_length - len(selected_content)
-            beginning = content[:remaining_space]
+        if used_tokens < max_tokens:
+            beginning = _truncate_tokens(content, max_tokens - used_tokens)
             selected_content = beginning + "\n\n" + selected_content
         
-        return selected_content[:max_length]
+        return selected_content
     
-    def factcheck_claim(self, claim: str, scraped_content: str) -> Optional[Dict[str, Any]]:
+    def factcheck_claim(self, claim: str, scraped_content: str,
+                        response_format: Optional[dict] = None) -> Optional[Dict[str, Any]]:
         """Fact-check a claim against scraped content using local model."""
+        response = self._make_request(
+            self._factcheck_prompt(claim, scraped_content), max_tokens=1000,
+            response_format=response_format, stop_at_key="label",
+        )
+        return self._parse_factcheck(response)
+    
+    def factcheck_claims(self, pairs: list[tuple[str, str]],
+                         response_format: Optional[dict] = None) -> list[Optional[Dict[str, Any]]]:
+        """Batched factcheck_claim over (claim, scraped_content) pairs."""
+        prompts = [self._factcheck_prompt(claim, scraped_content) for claim, scraped_content in pairs]
+        responses = self.batch_responses(prompts, max_tokens=1000, response_format=response_format)
+        return [self._parse_factcheck(response) for response in responses]
+    
+    def _factcheck_prompt(self, claim: str, scraped_content: str) -> str:
         # Smart content selection: find relevant sections instead of just truncating
         truncated_content = self._select_relevant_content(claim, scraped_content)
         
-        prompt = f"""Based on the following scraped content from a web page, please analyze the claim and provide:
-1. A label of either "True" or "False" based on whether the claim is supported by the content
-2. A single contiguous block of text from the article that verifies or disproves the claim
-
-IMPORTANT: The evidence must be a concise, single, unbroken string of text directly copied from the scraped content. 
-Do not combine multiple separate sentences or paragraphs. Find the most relevant and concise single block of text that 
-directly verifies or disproves the claim.
-
-Return your response in this exact JSON format:
-{{"label": "True" or "False", "evidence": "single contiguous block of text from the article"}}
-
-Claim: "{claim}"
-
-Scraped Content:
-{truncated_content}"""
-        
-        response = self._make_request(prompt, max_tokens=1000)
+        return factcheck_prompt(claim, truncated_content)
+    
+    def _parse_factcheck(self, response: Optional[str]) -> Optional[Dict[str, Any]]:
         if not response:
             return None
         
-        try:
-            # Try to parse JSON from response
-            import re
-            json_match = re.search(r'\{[^}]*"label"[^}]*"evidence"[^}]*\}', response)
-            if json_match:
-                return json.loads(json_match.group())
-        except Exception:
-            pass
+        result = _find_json(response, '{')
+        if isinstance(result, dict) and "label" in result and "evidence" in result:
+            return result
         
         # Fallback: try to extract True/False and evidence
         try:
@@ -180,7 +569,7 @@ Scraped Content:
                 label = "False"
             
             # Extract evidence (everything after "evidence":)
-            evidence_match = re.search(r'"evidence":\s*"([^"]*)"', response)
+            evidence_match = _EVIDENCE_RE.search(response)
             evidence = evidence_match.group(1) if evidence_match else response[:200]
             
             return {"label": label, "evidence": evidence}
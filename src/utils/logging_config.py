@@ -0,0 +1,33 @@
+import logging
+import sys
+
+# Third-party loggers that are only worth seeing at -vv
+_NOISY_LOGGERS = (
+    "urllib3",
+    "asyncio",
+    "aiohttp",
+    "openai",
+    "httpx",
+    "httpcore",
+    "charset_normalizer",
+)
+
+
+def configure_logging(verbosity: int = 0) -> None:
+    """
+    Route all output through a single stdout handler that writes whole records, so
+    lines from worker threads never interleave.
+
+      0     results and summaries
+      1 -v  per-step progress and timings
+      2 -vv debug output from third-party libraries too
+    """
+    logging.basicConfig(
+        stream=sys.stdout,
+        format="%(message)s",
+        level=logging.DEBUG if verbosity >= 1 else logging.INFO,
+        force=True,
+    )
+    if verbosity < 2:
+        for name in _NOISY_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
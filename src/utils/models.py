@@ -9,3 +9,8 @@ class ClaimResult(BaseModel):
 # Root model holding a JSON array of strings
 class ExtractedClaims(RootModel[list[str]]):
     pass
+
+
+# Object form of ExtractedClaims: structured outputs need an object at the root
+class ClaimList(BaseModel):
+    claims: list[str]
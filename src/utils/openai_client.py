@@ -1,8 +1,17 @@
-from openai import OpenAI
+import functools
+
+from openai import AsyncOpenAI, OpenAI
 
 
 # A thin wrapper so other modules don't import OpenAI directly
+@functools.lru_cache(maxsize=1)
 def get_client() -> OpenAI:
     # The OpenAI SDK will read OPENAI_API_KEY from env automatically,
     # but we ensure it's present via config.validate_settings() in main.
+    # One shared client, so sync calls reuse its connection pool.
     return OpenAI()
+
+
+def get_async_client() -> AsyncOpenAI:
+    # Not shared: an async client's connections belong to the event loop that opened them
+    return AsyncOpenAI()
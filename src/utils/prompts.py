@@ -0,0 +1,58 @@
+"""
+Per-call prompt builders.
+
+Each prompt is its static PREFIX from constants followed by a short per-call
+suffix. Suffixes are built with f-strings, which compile to plain concatenation:
+no format-string parsing at call time and no extra pass over large scraped text.
+
+Chat-style callers send the PREFIX as the system message and the suffix
+(`*_input`) as the user message (see `messages`), so the provider sees an
+identical leading block on every call and can serve it from its prefix cache.
+Completion-style callers send the concatenated `*_prompt` instead.
+"""
+
+from .constants import (
+    PROMPT_EXTRACT_CLAIMS_PREFIX,
+    PROMPT_FACTCHECK_PREFIX,
+    PROMPT_OPTIMIZE_CLAIM_PREFIX,
+    PROMPT_WIKI_ARTICLE_NAME_PREFIX,
+)
+
+
+def messages(instructions: str, user_input: str) -> list[dict]:
+    return [
+        {"role": "system", "content": instructions},
+        {"role": "user", "content": user_input},
+    ]
+
+
+def extract_claims_input(query: str) -> str:
+    return f'"{query}"'
+
+
+def optimize_claim_input(claim: str) -> str:
+    return f"Claim: {claim}"
+
+
+def wiki_article_name_input(claim: str) -> str:
+    return f'"{claim}"'
+
+
+def factcheck_input(claim: str, scraped: str) -> str:
+    return f'Claim: "{claim}"\n\nScraped Content:\n{scraped}'
+
+
+def extract_claims_prompt(query: str) -> str:
+    return PROMPT_EXTRACT_CLAIMS_PREFIX + extract_claims_input(query)
+
+
+def optimize_claim_prompt(claim: str) -> str:
+    return PROMPT_OPTIMIZE_CLAIM_PREFIX + optimize_claim_input(claim)
+
+
+def wiki_article_name_prompt(claim: str) -> str:
+    return PROMPT_WIKI_ARTICLE_NAME_PREFIX + wiki_article_name_input(claim)
+
+
+def factcheck_prompt(claim: str, scraped: str) -> str:
+    return PROMPT_FACTCHECK_PREFIX + factcheck_input(claim, scraped)
@@ -0,0 +1,149 @@
+"""
+Lexical retrieval used to trim scraped articles before fact-checking.
+
+Prefill cost grows with prompt length, so instead of sending a whole Wikipedia
+article to the model we keep only the sentences that BM25 ranks as most
+relevant to the claim.
+"""
+
+import atexit
+import heapq
+import math
+import multiprocessing
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Sequence, Union
+
+from .wikipedia_scraper import split_sentences
+
+# Roughly 2k tokens of context for typical Wikipedia prose
+DEFAULT_TOP_K_SENTENCES = 32
+
+# Articles at least this long (in characters) are ranked in worker processes by
+# bm25_topk_many; below it, pickling the text costs more than the GIL does
+PROCESS_POOL_MIN_CHARS = 200_000
+
+_TOKEN_RE = re.compile(r"\w+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by did do does for from had has have he her his in is it its "
+    "of on or she that the their they this to was were which who with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Corpus statistics for BM25 over tokenized docs: per-term postings (doc index
+    and term frequency), doc lengths and the average length. Built once per
+    article so each claim only pays for scoring its own query terms.
+    """
+
+    __slots__ = ("n_docs", "lengths", "avg_len", "postings")
+
+    def __init__(self, docs: Sequence[Sequence[str]]):
+        self.n_docs = len(docs)
+        self.lengths = [len(doc) for doc in docs]
+        self.avg_len = (sum(self.lengths) / self.n_docs if self.n_docs else 0.0) or 1.0
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        for i, doc in enumerate(docs):
+            for term, tf in Counter(doc).items():
+                self.postings.setdefault(term, []).append((i, tf))
+
+
+def bm25_scores(
+    query: list[str], index: BM25Index, k1: float = 1.5, b: float = 0.75
+) -> list[float]:
+    """Okapi BM25 score of every doc in `index` against the tokenized query."""
+    scores = [0.0] * index.n_docs
+    for term in set(query):
+        postings = index.postings.get(term)
+        if not postings:
+            continue
+        df = len(postings)
+        idf = math.log((index.n_docs - df + 0.5) / (df + 0.5) + 1.0)
+        for i, tf in postings:
+            norm = k1 * (1 - b + b * index.lengths[i] / index.avg_len)
+            scores[i] += idf * tf * (k1 + 1) / (tf + norm)
+    return scores
+
+
+@lru_cache(maxsize=64)
+def _index_sentences(content: str) -> tuple[tuple[str, ...], BM25Index]:
+    """Sentences of an article with their BM25 index, memoized per article like split_sentences."""
+    sentences = split_sentences(content)
+    return sentences, BM25Index([tokenize(s) for s in sentences])
+
+
+def bm25_topk(
+    content: Union[str, Sequence[str]], claim: str, k: int = DEFAULT_TOP_K_SENTENCES
+) -> str:
+    """
+    Keep the k sentences of `content` most relevant to `claim`, in document order.
+    `content` is raw article text (split and BM25-indexed once per article) or a
+    sentence list. Raw text that is already k sentences or shorter is returned
+    unchanged. Kept sentences are separated by
+    blank lines, so paragraph-level selection downstream (the local client's
+    _select_relevant_content) can still rank and budget each one.
+    """
+    if isinstance(content, str):
+        sentences, index = _index_sentences(content)
+        if len(sentences) <= k:
+            return content
+    else:
+        sentences = content
+        if len(sentences) <= k:
+            return "\n\n".join(sentences)
+        index = BM25Index([tokenize(s) for s in sentences])
+
+    scores = bm25_scores(tokenize(claim), index)
+    top = sorted(heapq.nlargest(k, range(len(sentences)), key=scores.__getitem__))
+    return "\n\n".join(sentences[i] for i in top)
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        # spawn, not fork: callers run this from processes that already have I/O threads
+        _process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
+        atexit.register(_process_pool.shutdown, wait=False)
+    return _process_pool
+
+
+def _content_chars(content: Union[str, Sequence[str]]) -> int:
+    # len() of a str is O(1); only sentence lists need summing
+    return len(content) if isinstance(content, str) else sum(map(len, content))
+
+
+def bm25_topk_many(
+    pairs: list[tuple[Union[str, Sequence[str]], str]], k: int = DEFAULT_TOP_K_SENTENCES
+) -> list[str]:
+    """
+    bm25_topk over (content, claim) pairs, in order. Very large articles are
+    tokenized and scored on a shared process pool so they run in parallel; the
+    rest stay on the calling thread.
+    """
+    large = [
+        i
+        for i, (content, _claim) in enumerate(pairs)
+        if _content_chars(content) >= PROCESS_POOL_MIN_CHARS
+    ]
+    futures = {
+        i: _get_process_pool().submit(bm25_topk, pairs[i][0], pairs[i][1], k)
+        for i in large
+    }
+    return [
+        futures[i].result() if i in futures else bm25_topk(content, claim, k)
+        for i, (content, claim) in enumerate(pairs)
+    ]
@@ -0,0 +1,55 @@
+"""
+In-process cache for short LLM inputs (queries, claims) that differ only in
+formatting.
+
+Inputs are compared after casefolding, collapsing whitespace and stripping trailing
+sentence punctuation, so "Ada Lovelace was born in 1815." and "ada lovelace  was
+born in 1815" share an answer. Anything that changes the words, their order or the
+punctuation inside them is a different input: "Paris is the capital of France"
+never reuses the answer for "France is the capital of Paris", nor "He won" for
+"She won", "3.5" for "3-5" or "C++" for "C".
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Sentence-final punctuation; signs, decimal points and the like inside tokens are kept
+_TRAILING_PUNCTUATION = ".!?;,: \t\n"
+
+
+def normalize(text: str) -> str:
+    return (
+        _WHITESPACE_RE.sub(" ", text.casefold()).strip().rstrip(_TRAILING_PUNCTUATION)
+    )
+
+
+class SemanticCache:
+    """Bounded LRU of (namespace, normalized input) -> value."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, text: str) -> Optional[Any]:
+        key = (namespace, normalize(text))
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, namespace: str, text: str, value: Any) -> None:
+        normalized = normalize(text)
+        if not normalized:
+            return
+        with self._lock:
+            key = (namespace, normalized)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
+import re
 import time
+from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse, unquote
 
+import aiohttp
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .constants import WIKI_USER_AGENT
+from .llm_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
 
 REMOVE_SELECTORS = [
     ".navbox",
@@ -21,13 +32,59 @@ REMOVE_SELECTORS = [
     ".mw-cite-backlink",
 ]
 
-# Shared session with retries and a compliant User-Agent
+# Shared session with pooled keep-alive connections, retries and a compliant User-Agent
 _session = requests.Session()
-_adapter = requests.adapters.HTTPAdapter(max_retries=3)
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
 _session.mount("https://", _adapter)
 _session.headers.update({"User-Agent": WIKI_USER_AGENT, "Accept": "text/html,*/*"})
 
 
+def get_session() -> requests.Session:
+    return _session
+
+
+# Article text is stable enough to reuse for a day, across runs and processes
+WIKI_CACHE_PATH = Path(__file__).resolve().parents[2] / ".wiki_cache.sqlite"
+WIKI_CACHE_TTL = 24 * 60 * 60
+_wiki_cache = SQLiteCache(WIKI_CACHE_PATH, ttl=WIKI_CACHE_TTL)
+
+
+def get_wiki_cache() -> SQLiteCache:
+    return _wiki_cache
+
+
+# Sentence boundary: terminal punctuation, whitespace, then something that can start a sentence
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+(?=["“(\[]?[A-Z0-9])')
+# A piece ending in an abbreviation or initial ("Dr.", "St.", "U.S.", "J.") is not a sentence end
+_NON_TERMINAL_RE = re.compile(
+    r"(?:\b(?:Mr|Mrs|Ms|Dr|St|Mt|Jr|Sr|Prof|Gen|Col|Lt|Gov|Rev|No|Vol|vs|ca|c|approx)|\b[A-Z])\.$"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def split_sentences(text: str) -> tuple[str, ...]:
+    """
+    Cheap local sentence segmentation for scraped article text.
+    Paragraph/line breaks always end a sentence; abbreviations and initials don't.
+    Memoized: one article is usually ranked against several claims (retrieve.bm25_topk).
+    """
+    sentences = []
+    for block in text.split("\n"):
+        pending = ""
+        for piece in _SENTENCE_BOUNDARY_RE.split(block.strip()):
+            pending = f"{pending} {piece}" if pending else piece
+            if not _NON_TERMINAL_RE.search(pending):
+                sentences.append(pending)
+                pending = ""
+        if pending:
+            sentences.append(pending)
+    return tuple(s for s in sentences if s)
+
+
 def _extract_title_from_wiki_url(url: str) -> Optional[str]:
     """
     Convert https://en.wikipedia.org/wiki/Ada_Lovelace  -> Ada_Lovelace
@@ -45,13 +102,22 @@ def _extract_title_from_wiki_url(url: str) -> Optional[str]:
     return None
 
 
+def _normalize_title(title: str) -> str:
+    """
+    Canonical cache key for an article title, so URL variants of the same page
+    ("ada lovelace", "Ada_Lovelace") share one entry.
+    """
+    title = title.strip().replace(" ", "_")
+    return title[:1].upper() + title[1:]
+
+
 def _wiki_rest_plain_text(title: str) -> Optional[str]:
     """
     Wikipedia REST: plain text of a page.
     Docs: https://en.wikipedia.org/api/rest_v1/#/Page%20content/get_page_plain_title
     """
     rest_url = f"https://en.wikipedia.org/api/rest_v1/page/plain/{title}"
-    r = _session.get(rest_url, timeout=30)
+    r = get_session().get(rest_url, timeout=30)
     if r.status_code == 200 and r.text.strip():
         # The plain endpoint already returns readable text
         return r.text
@@ -64,10 +130,14 @@ def _wiki_rest_mobile_html(title: str) -> Optional[str]:
     Docs: https://en.wikipedia.org/api/rest_v1/#/Page%20content/get_page_mobile_html_title
     """
     rest_url = f"https://en.wikipedia.org/api/rest_v1/page/mobile-html/{title}"
-    r = _session.get(rest_url, timeout=30, headers={"Accept": "text/html"})
+    r = get_session().get(rest_url, timeout=30, headers={"Accept": "text/html"})
     if r.status_code != 200:
         return None
-    soup = BeautifulSoup(r.text, "html.parser")
+    return _parse_mobile_html(r.text)
+
+
+def _parse_mobile_html(html: str) -> Optional[str]:
+    soup = BeautifulSoup(html, "html.parser")
 
     # Remove non-content elements similar to desktop selectors
     for sel in REMOVE_SELECTORS:
@@ -87,9 +157,13 @@ def _generic_html_scrape(url: str) -> Optional[str]:
     Fallback: generic HTML scrape with proper headers.
     Some sites reject non-browser UAs — we comply with Wikipedia’s UA policy above.
     """
-    r = _session.get(url, timeout=30)
+    r = get_session().get(url, timeout=30)
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    return _parse_generic_html(r.text)
+
+
+def _parse_generic_html(html: str) -> Optional[str]:
+    soup = BeautifulSoup(html, "html.parser")
 
     content = soup.select_one("#mw-content-text .mw-parser-output") or soup
     for sel in REMOVE_SELECTORS:
@@ -104,34 +178,60 @@ def _generic_html_scrape(url: str) -> Optional[str]:
     return "\n\n".join(blocks) if blocks else None
 
 
+def _scrape_wiki_title(title: str) -> Optional[str]:
+    """Wikipedia REST strategies for a title: plain text, then mobile-html."""
+    # 1) Plain-text API
+    try:
+        txt = _wiki_rest_plain_text(title)
+        if txt:
+            return txt
+    except requests.HTTPError:
+        pass
+    except Exception:
+        pass
+
+    # 2) Mobile HTML API
+    try:
+        txt = _wiki_rest_mobile_html(title)
+        if txt:
+            return txt
+    except requests.HTTPError:
+        pass
+    except Exception:
+        pass
+    return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_wiki_title(title: str) -> str:
+    """
+    In-process memo over the on-disk cache. Misses raise instead of returning None
+    so lru_cache never remembers a failed fetch.
+    """
+    hit = get_wiki_cache().get(title)
+    if hit is not None:
+        return hit
+    txt = _scrape_wiki_title(title)
+    if not txt:
+        raise LookupError(title)
+    get_wiki_cache().set(title, txt)
+    return txt
+
+
 def scrape_wikipedia_content(url: str) -> Optional[str]:
     """
     Robust scraper:
       • If URL is Wikipedia, prefer REST API (plain → mobile-html) to avoid 403s.
+        Results are cached by normalized title for WIKI_CACHE_TTL.
       • Otherwise, fall back to generic HTML scraping.
       • Always send a proper User-Agent and retry gently.
     """
     # Try Wikipedia-specific strategies if applicable
     title = _extract_title_from_wiki_url(url)
     if title:
-        # 1) Plain-text API
         try:
-            txt = _wiki_rest_plain_text(title)
-            if txt:
-                return txt
-        except requests.HTTPError:
-            pass
-        except Exception:
-            pass
-
-        # 2) Mobile HTML API
-        try:
-            txt = _wiki_rest_mobile_html(title)
-            if txt:
-                return txt
-        except requests.HTTPError:
-            pass
-        except Exception:
+            return _cached_wiki_title(_normalize_title(title))
+        except LookupError:
             pass
 
         # Small backoff before generic try
@@ -142,8 +242,98 @@ def scrape_wikipedia_content(url: str) -> Optional[str]:
         return _generic_html_scrape(url)
     except requests.HTTPError as e:
         # Surface a clean error line like your original
-        print(f"[ERROR] Wikipedia scraping failed: {e}")
+        logger.error("Wikipedia scraping failed: %s", e)
+        return None
+    except Exception as e:
+        logger.error("Wikipedia scraping failed: %s", e)
         return None
+
+
+async def _fetch_text(
+    session: aiohttp.ClientSession, url: str, **kwargs
+) -> tuple[int, str]:
+    async with session.get(url, **kwargs) as r:
+        return r.status, await r.text()
+
+
+async def _scrape_wiki_title_async(
+    session: aiohttp.ClientSession, title: str
+) -> Optional[str]:
+    # 1) Plain-text API
+    try:
+        status, text = await _fetch_text(
+            session, f"https://en.wikipedia.org/api/rest_v1/page/plain/{title}"
+        )
+        if status == 200 and text.strip():
+            return text
+    except Exception:
+        pass
+
+    # 2) Mobile HTML API
+    try:
+        status, html = await _fetch_text(
+            session,
+            f"https://en.wikipedia.org/api/rest_v1/page/mobile-html/{title}",
+            headers={"Accept": "text/html"},
+        )
+        if status == 200:
+            return await asyncio.to_thread(_parse_mobile_html, html)
+    except Exception:
+        pass
+    return None
+
+
+async def _scrape_async(session: aiohttp.ClientSession, url: str) -> Optional[str]:
+    """
+    Async twin of scrape_wikipedia_content: same plain → mobile-html → generic
+    fallback chain and title cache, but on a shared aiohttp session. Cache reads
+    and writes and HTML parsing run on worker threads, off the event loop.
+    """
+    title = _extract_title_from_wiki_url(url)
+    if title:
+        title = _normalize_title(title)
+        hit = await asyncio.to_thread(get_wiki_cache().get, title)
+        if hit is not None:
+            return hit
+
+        txt = await _scrape_wiki_title_async(session, title)
+        if txt:
+            await asyncio.to_thread(get_wiki_cache().set, title, txt)
+            return txt
+
+        # Small backoff before generic try
+        await asyncio.sleep(0.4)
+
+    # 3) Generic scrape (works for non-Wikipedia or as last resort)
+    try:
+        status, html = await _fetch_text(session, url)
+        if status >= 400:
+            logger.error("Wikipedia scraping failed: HTTP %s for url: %s", status, url)
+            return None
+        return await asyncio.to_thread(_parse_generic_html, html)
     except Exception as e:
-        print(f"[ERROR] Wikipedia scraping failed: {e}")
+        logger.error("Wikipedia scraping failed: %s", e)
         return None
+
+
+def open_scrape_session() -> aiohttp.ClientSession:
+    """Pooled aiohttp session for scrape_all; share one across a batch and close it after."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300),
+        headers={"User-Agent": WIKI_USER_AGENT, "Accept": "text/html,*/*"},
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+
+
+async def scrape_all(
+    urls: list[str], session: Optional[aiohttp.ClientSession] = None
+) -> list[Optional[str]]:
+    """
+    Scrape many URLs concurrently on one event loop and one pooled connector.
+    Results are returned in the same order as `urls`. Pass `session` (see
+    open_scrape_session) to reuse its connections across calls.
+    """
+    if session is None:
+        async with open_scrape_session() as session:
+            return await scrape_all(urls, session)
+    return await asyncio.gather(*[_scrape_async(session, url) for url in urls])